@@ -231,10 +231,20 @@ def render_header():
         st.warning("💎 **Worth It** - Value justifies effort")
 
 
-def render_problem_dashboard():
-    """Render 4D diagnostic dashboard"""
-    diagnosis = get_diagnosis()
+def render_problem_dashboard(slot=None):
+    """Render 4D diagnostic dashboard
 
+    Args:
+        slot: Optional placeholder (from ``st.empty()``) to render into, so the
+            dashboard can be filled in after the chat response has streamed
+    """
+    container = slot.container() if slot is not None else st.container()
+    with container:
+        _render_dashboard_metrics(get_diagnosis())
+
+
+def _render_dashboard_metrics(diagnosis):
+    """Render the 4D diagnosis metrics into the current container"""
     st.subheader("📊 Problem Diagnosis")
 
     col1, col2 = st.columns(2)
@@ -364,10 +374,10 @@ def main():
     render_header()
     render_sidebar()
 
-    # Show dashboard if there's conversation
-    if st.session_state.total_turns > 0:
-        render_problem_dashboard()
-    else:
+    # Reserve the dashboard slot; it is filled in after the chat turn so the
+    # streamed response gets painted first
+    dashboard_slot = st.empty()
+    if st.session_state.total_turns == 0:
         # Welcome message
         st.info("💡 **Welcome!** I'm here to help you navigate complex problems using the PWS methodology.")
 
@@ -422,6 +432,10 @@ def main():
         # Rerun to update dashboard
         st.rerun()
 
+    # Show dashboard if there's conversation
+    if st.session_state.total_turns > 0:
+        render_problem_dashboard(slot=dashboard_slot)
+
 
 if __name__ == "__main__":
     main()
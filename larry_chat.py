@@ -4,13 +4,15 @@ Primary: Gemini File Search (fast, streaming)
 Secondary: Neo4j and Web Search (when intelligently detected)
 """
 
+import asyncio
 import os
-import json
-from typing import Iterator, Optional
-from google import genai
-from google.genai import types
+import time
+from collections import deque
+from typing import AsyncIterator, Iterator, Optional
 
+from larry_gemini_client import get_client, get_prompt_cache
 from larry_router import route_query, should_use_streaming, get_route_description
+from larry_store import STORE_INFO_FILE, load_store_info
 
 # Neo4j tool - optional import (won't break if dependencies missing)
 try:
@@ -33,6 +35,167 @@ except ImportError:
 
 from larry_system_prompt_v3 import LARRY_SYSTEM_PROMPT
 
+# The google-genai SDK (grpc/protobuf/auth) is imported on first use, not at
+# module import, so routing-only callers don't pay its cold-start cost
+
+# Use Gemini 3 Pro Preview (best reasoning capability)
+FILE_SEARCH_MODEL = "gemini-3-pro-preview"
+
+# Number of previous messages sent to Gemini as conversation context
+HISTORY_WINDOW = 10
+
+# Reply for empty / whitespace-only messages (no routing or model call)
+EMPTY_MESSAGE_REPLY = "Please enter a question."
+
+# Streamed text is coalesced until this many characters or seconds accumulate
+STREAM_COALESCE_CHARS = 64
+STREAM_COALESCE_SECONDS = 0.04
+
+# Appended to the user message when show_thinking is enabled
+REASONING_INSTRUCTIONS = (
+    "\n\n"
+    "Please think through this step-by-step:\n"
+    "1. First, explain what information you're searching for\n"
+    "2. Then, show your reasoning process\n"
+    "3. Finally, provide your answer\n\n"
+    "Format your response with: **Thinking:** section first, then **Answer:** section."
+)
+
+
+def new_conversation_history() -> deque:
+    """Create a history buffer that keeps only the last HISTORY_WINDOW messages."""
+    return deque(maxlen=HISTORY_WINDOW)
+
+
+def _recent_history(conversation_history):
+    """
+    Return the last HISTORY_WINDOW messages without copying when possible.
+
+    A deque already bounded to the window (see new_conversation_history) is
+    iterated as-is; any other sequence falls back to a tail slice.
+    """
+    if isinstance(conversation_history, deque):
+        if conversation_history.maxlen is not None and conversation_history.maxlen <= HISTORY_WINDOW:
+            return conversation_history
+        conversation_history = list(conversation_history)
+    return conversation_history[-HISTORY_WINDOW:]
+
+
+def _coalesce(chunks: Iterator[str]) -> Iterator[str]:
+    """
+    Merge small stream chunks into fewer, larger ones.
+
+    Text is buffered until STREAM_COALESCE_CHARS have accumulated or
+    STREAM_COALESCE_SECONDS have passed since the last flush, so consumers
+    re-render (or send) once per batch instead of once per token. The first
+    chunk of a response is never delayed, and the buffer is always flushed
+    at the end of the stream.
+    """
+    buffer = []
+    buffered_chars = 0
+    last_flush = float("-inf")  # first chunk goes out immediately
+    for chunk in chunks:
+        buffer.append(chunk)
+        buffered_chars += len(chunk)
+        now = time.monotonic()
+        if buffered_chars >= STREAM_COALESCE_CHARS or now - last_flush >= STREAM_COALESCE_SECONDS:
+            yield "".join(buffer)
+            buffer.clear()
+            buffered_chars = 0
+            last_flush = now
+    if buffer:
+        yield "".join(buffer)
+
+
+async def _coalesce_async(chunks: AsyncIterator[str]) -> AsyncIterator[str]:
+    """Async counterpart of _coalesce()."""
+    buffer = []
+    buffered_chars = 0
+    last_flush = float("-inf")
+    async for chunk in chunks:
+        buffer.append(chunk)
+        buffered_chars += len(chunk)
+        now = time.monotonic()
+        if buffered_chars >= STREAM_COALESCE_CHARS or now - last_flush >= STREAM_COALESCE_SECONDS:
+            yield "".join(buffer)
+            buffer.clear()
+            buffered_chars = 0
+            last_flush = now
+    if buffer:
+        yield "".join(buffer)
+
+
+def _chunk_parts(chunk) -> tuple:
+    """Return the parts of a streamed chunk's first candidate (empty if none)."""
+    candidates = getattr(chunk, 'candidates', None)
+    if not candidates:
+        return ()
+    content = getattr(candidates[0], 'content', None)
+    return getattr(content, 'parts', None) or ()
+
+
+class _FileSearchStream:
+    """Per-response state that turns streamed Gemini chunks into output text."""
+
+    def __init__(self):
+        self.thinking_shown = False
+        self.collected_sources = []
+
+    def consume(self, chunk) -> list:
+        """Return the text to emit for one chunk, recording any grounding sources."""
+        # Walk the parts tree once: thinking, sources and text together
+        output = []
+        chunk_text = []
+        for part in _chunk_parts(chunk):
+            thought = getattr(part, 'thought', None)
+
+            # Show thinking section (if model supports it)
+            if thought and not self.thinking_shown:
+                output.append(f"\n<details>\n<summary>🧠 <b>Larry's Reasoning Process</b></summary>\n\n```\n{thought}\n```\n</details>\n\n")
+                self.thinking_shown = True
+
+            # Collect grounding metadata (sources used)
+            grounding_metadata = getattr(part, 'grounding_metadata', None)
+            if grounding_metadata and hasattr(grounding_metadata, 'grounding_chunks'):
+                for grounding_chunk in grounding_metadata.grounding_chunks:
+                    if hasattr(grounding_chunk, 'retrieved_context'):
+                        context = grounding_chunk.retrieved_context
+                        source_info = {}
+
+                        if hasattr(context, 'title'):
+                            source_info['title'] = context.title
+                        if hasattr(context, 'uri'):
+                            source_info['uri'] = context.uri
+
+                        # Get confidence score if available
+                        if hasattr(grounding_chunk, 'grounding_score'):
+                            source_info['confidence'] = grounding_chunk.grounding_score
+
+                        if source_info and source_info not in self.collected_sources:
+                            self.collected_sources.append(source_info)
+
+            # Same rule as chunk.text: skip thought parts
+            text = getattr(part, 'text', None)
+            if text and not thought:
+                chunk_text.append(text)
+
+        # Main response text
+        if chunk_text:
+            output.append("".join(chunk_text))
+        return output
+
+    def sources_footer(self) -> Optional[str]:
+        """Return the sources footer, built as one string so the UI re-renders once."""
+        if not self.collected_sources:
+            return None
+        footer_lines = ["\n\n---\n\n**📚 Sources Referenced:**\n\n"]
+        for i, source in enumerate(self.collected_sources[:5], 1):
+            title = source.get('title', 'Unknown')
+            confidence = source.get('confidence', None)
+            conf_str = f" (confidence: {confidence:.2f})" if confidence else ""
+            footer_lines.append(f"{i}. {title}{conf_str}\n")
+        return "".join(footer_lines)
+
 
 class LarryChat:
     """Main chat handler with intelligent routing and streaming support."""
@@ -47,19 +210,57 @@ class LarryChat:
         self.neo4j_tool = None
         self.web_search_tool = WebSearchTool()
 
-        # Initialize Gemini client
-        if self.gemini_api_key:
-            self.gemini_client = genai.Client(api_key=self.gemini_api_key)
-        else:
-            self.gemini_client = None
+        # Gemini client is shared process-wide (see larry_gemini_client)
+        self.gemini_client = get_client(self.gemini_api_key)
+
+        # File Search tool is fixed once the store is known, so build it once
+        self._file_search_tools = None
+        if self.file_search_store:
+            from google.genai import types
+
+            self._file_search_tools = [
+                types.Tool(
+                    file_search=types.FileSearch(
+                        file_search_store_names=[self.file_search_store]
+                    )
+                )
+            ]
+
+        # Generation configs are rebuilt only when the prompt cache rotates
+        self._configs = None
+        self._configs_cache_name = None
     
+    def _generation_configs(self) -> tuple:
+        """
+        Return (file_search_config, web_search_config).
+
+        When the system prompt is held in a Gemini context cache, the configs
+        reference it by name and the prompt + tools are not re-sent each turn;
+        otherwise they carry them inline.
+        """
+        cache_name = None
+        if self.gemini_client:
+            cache_name = get_prompt_cache(self.gemini_client, FILE_SEARCH_MODEL, LARRY_SYSTEM_PROMPT,
+                                          self._file_search_tools, cache_key=self.file_search_store)
+
+        if self._configs is None or cache_name != self._configs_cache_name:
+            from google.genai import types
+
+            if cache_name:
+                prompt_args = {"cached_content": cache_name}
+            else:
+                prompt_args = {"system_instruction": LARRY_SYSTEM_PROMPT, "tools": self._file_search_tools}
+            self._configs = (
+                types.GenerateContentConfig(temperature=0.7, max_output_tokens=8192, **prompt_args),
+                types.GenerateContentConfig(temperature=0.7, max_output_tokens=4096, **prompt_args),
+            )
+            self._configs_cache_name = cache_name
+        return self._configs
+
     def _load_file_search_store(self) -> Optional[str]:
         """Load file search store name from configuration."""
         try:
-            if os.path.exists("larry_store_info.json"):
-                with open("larry_store_info.json", "r") as f:
-                    store_info = json.load(f)
-                    return store_info.get("store_name")
+            return load_store_info(STORE_INFO_FILE).get("store_name")
         except Exception as e:
             print(f"Failed to load file search store: {e}")
         return None
@@ -70,23 +271,75 @@ class LarryChat:
 
         Args:
             user_message: The user's input message
-            conversation_history: List of previous messages for context
+            conversation_history: Previous messages for context (a list, or a
+                bounded deque from new_conversation_history())
             show_thinking: Whether to display reasoning process (default: True)
 
         Yields:
             Response chunks (for streaming) or complete response
         """
+        # Nothing to route or classify for empty / whitespace-only input
+        user_message = user_message.strip()
+        if not user_message:
+            yield EMPTY_MESSAGE_REPLY
+            return
+
         # Route the query
         route = route_query(user_message)
 
         # Handle based on route
         if route == "neo4j" and self.neo4j_tool:
-            yield from self._handle_neo4j(user_message)
+            chunks = self._handle_neo4j(user_message)
         elif route == "web_search":
-            yield from self._handle_web_search(user_message)
+            chunks = self._handle_web_search(user_message)
+        else:  # file_search (default)
+            chunks = self._handle_file_search(user_message, conversation_history, show_thinking)
+
+        yield from _coalesce(chunks)
+
+    async def chat_async(self, user_message: str, conversation_history: list = None, show_thinking: bool = True) -> AsyncIterator[str]:
+        """
+        Async variant of chat() for ASGI servers.
+
+        File search streams through the async Gemini client, so awaiting the
+        next chunk never blocks the event loop. The Neo4j and web search
+        handlers are blocking, so they are driven from a worker thread.
+
+        Yields:
+            Response chunks, exactly as chat() would
+        """
+        user_message = user_message.strip()
+        if not user_message:
+            yield EMPTY_MESSAGE_REPLY
+            return
+
+        route = route_query(user_message)
+
+        if route == "web_search" or (route == "neo4j" and self.neo4j_tool):
+            chunks = self.chat(user_message, conversation_history, show_thinking)
+            done = object()
+            while (chunk := await asyncio.to_thread(next, chunks, done)) is not done:
+                yield chunk
         else:  # file_search (default)
-            yield from self._handle_file_search(user_message, conversation_history, show_thinking)
+            chunks = self._handle_file_search_async(user_message, conversation_history, show_thinking)
+            async for chunk in _coalesce_async(chunks):
+                yield chunk
     
+    def _file_search_contents(self, user_message: str, conversation_history=None, show_thinking: bool = True) -> list:
+        """Build the Gemini contents (recent history + current message) for file search."""
+        # If showing thinking, append the reasoning instruction to the user message
+        current_text = user_message
+        if show_thinking:
+            current_text = f"{user_message}{REASONING_INSTRUCTIONS}"
+
+        # Build conversation context: history + current message in one pass
+        contents = [
+            {"role": "user" if msg["role"] == "user" else "model", "parts": [{"text": msg["content"]}]}
+            for msg in (_recent_history(conversation_history) if conversation_history else ())
+        ]
+        contents.append({"role": "user", "parts": [{"text": current_text}]})
+        return contents
+
     def _handle_file_search(self, user_message: str, conversation_history: list = None, show_thinking: bool = True) -> Iterator[str]:
         """Handle file search with Gemini streaming."""
         if not self.gemini_client:
@@ -94,110 +347,53 @@ class LarryChat:
             return
 
         try:
-            # Build conversation context
-            contents = []
-
-            # Add conversation history
-            if conversation_history:
-                for msg in conversation_history[-10:]:  # Last 10 messages for context
-                    role = "user" if msg["role"] == "user" else "model"
-                    contents.append({"role": role, "parts": [{"text": msg["content"]}]})
-
-            # Add current message
-            contents.append({"role": "user", "parts": [{"text": user_message}]})
-
-            # Configure generation with file search
-            config = types.GenerateContentConfig(
-                system_instruction=LARRY_SYSTEM_PROMPT,
-                temperature=0.7,
-                max_output_tokens=8192
-            )
+            contents = self._file_search_contents(user_message, conversation_history, show_thinking)
 
-            # Add file search tool if available
-            if self.file_search_store:
-                config.tools = [
-                    types.Tool(
-                        file_search=types.FileSearch(
-                            file_search_store_names=[self.file_search_store]
-                        )
-                    )
-                ]
-
-            # Use Gemini 3 Pro Preview (best reasoning capability)
-            model_name = "gemini-3-pro-preview"
-
-            # If showing thinking, prepend reasoning instruction to user message
-            if show_thinking and contents:
-                last_content = contents[-1]
-                original_text = last_content["parts"][0]["text"]
-                reasoning_prompt = (
-                    f"{original_text}\n\n"
-                    "Please think through this step-by-step:\n"
-                    "1. First, explain what information you're searching for\n"
-                    "2. Then, show your reasoning process\n"
-                    "3. Finally, provide your answer\n\n"
-                    "Format your response with: **Thinking:** section first, then **Answer:** section."
-                )
-                contents[-1] = {"role": "user", "parts": [{"text": reasoning_prompt}]}
-
-            # Stream response
+            # Stream response (config with file search is built in __init__)
             response = self.gemini_client.models.generate_content_stream(
-                model=model_name,
+                model=FILE_SEARCH_MODEL,
                 contents=contents,
-                config=config
+                config=self._generation_configs()[0]
             )
 
-            thinking_shown = False
-            sources_shown = False
-            collected_sources = []
-
+            stream = _FileSearchStream()
             for chunk in response:
-                # Extract thinking/reasoning if available
-                if hasattr(chunk, 'candidates') and chunk.candidates:
-                    candidate = chunk.candidates[0]
-
-                    # Check for thinking/reasoning in parts
-                    if hasattr(candidate, 'content') and hasattr(candidate.content, 'parts'):
-                        for part in candidate.content.parts:
-                            # Show thinking section (if model supports it)
-                            if hasattr(part, 'thought') and part.thought and not thinking_shown:
-                                yield f"\n<details>\n<summary>🧠 <b>Larry's Reasoning Process</b></summary>\n\n```\n{part.thought}\n```\n</details>\n\n"
-                                thinking_shown = True
-
-                            # Collect grounding metadata (sources used)
-                            if hasattr(part, 'grounding_metadata') and part.grounding_metadata:
-                                if hasattr(part.grounding_metadata, 'grounding_chunks'):
-                                    for grounding_chunk in part.grounding_metadata.grounding_chunks:
-                                        if hasattr(grounding_chunk, 'retrieved_context'):
-                                            context = grounding_chunk.retrieved_context
-                                            source_info = {}
-
-                                            if hasattr(context, 'title'):
-                                                source_info['title'] = context.title
-                                            if hasattr(context, 'uri'):
-                                                source_info['uri'] = context.uri
-
-                                            # Get confidence score if available
-                                            if hasattr(grounding_chunk, 'grounding_score'):
-                                                source_info['confidence'] = grounding_chunk.grounding_score
-
-                                            if source_info and source_info not in collected_sources:
-                                                collected_sources.append(source_info)
-
-                # Yield main response text
-                if chunk.text:
-                    yield chunk.text
+                yield from stream.consume(chunk)
 
             # Show sources at the end (after response completes)
-            if collected_sources and not sources_shown:
-                yield "\n\n---\n\n"
-                yield "**📚 Sources Referenced:**\n\n"
-                for i, source in enumerate(collected_sources[:5], 1):
-                    title = source.get('title', 'Unknown')
-                    confidence = source.get('confidence', None)
-                    conf_str = f" (confidence: {confidence:.2f})" if confidence else ""
-                    yield f"{i}. {title}{conf_str}\n"
-                sources_shown = True
+            footer = stream.sources_footer()
+            if footer:
+                yield footer
+
+        except Exception as e:
+            yield f"⚠️ Error: {str(e)}"
+
+    async def _handle_file_search_async(self, user_message: str, conversation_history: list = None, show_thinking: bool = True) -> AsyncIterator[str]:
+        """Handle file search with the async Gemini client (same output as _handle_file_search)."""
+        if not self.gemini_client:
+            yield "⚠️ Gemini is not configured. Please set GOOGLE_AI_API_KEY."
+            return
+
+        try:
+            contents = self._file_search_contents(user_message, conversation_history, show_thinking)
+            # Resolving the configs may create the prompt cache (a blocking
+            # call), so it runs in a worker thread, not on the event loop
+            config = (await asyncio.to_thread(self._generation_configs))[0]
+
+            response = await self.gemini_client.aio.models.generate_content_stream(
+                model=FILE_SEARCH_MODEL,
+                contents=contents,
+                config=config
+            )
+
+            stream = _FileSearchStream()
+            async for chunk in response:
+                for text in stream.consume(chunk):
+                    yield text
+
+            footer = stream.sources_footer()
+            if footer:
+                yield footer
 
         except Exception as e:
             yield f"⚠️ Error: {str(e)}"
@@ -271,21 +467,8 @@ Please provide a comprehensive answer that:
 
 Your response should be conversational and insightful."""
 
-            config = types.GenerateContentConfig(
-                system_instruction=LARRY_SYSTEM_PROMPT,
-                temperature=0.7,
-                max_output_tokens=4096
-            )
-
-            # Add File Search tool for hybrid context
-            if self.file_search_store:
-                config.tools = [
-                    types.Tool(
-                        file_search=types.FileSearch(
-                            file_search_store_names=[self.file_search_store]
-                        )
-                    )
-                ]
+            # File Search tool is attached for hybrid context (built in __init__)
+            config = self._generation_configs()[1]
 
             # Stream Gemini 3's synthesis
             response = self.gemini_client.models.generate_content_stream(
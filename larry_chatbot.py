@@ -4,31 +4,58 @@ Larry - Your Personal Uncertainty Navigator
 Chatbot with Lawrence Aronhime's teaching style
 """
 
-import json
+import asyncio
 import os
+import re
 import sys
+import time
+from collections import deque
+from functools import lru_cache
 from pathlib import Path
-from google import genai
-from google.genai import types
-from larry_system_prompt_v3 import LARRY_SYSTEM_PROMPT_V3
+from larry_gemini_client import get_client, get_prompt_cache
+from larry_semantic_cache import SemanticCache, normalize_question
+from larry_store import STORE_INFO_FILE, load_store_info
+from larry_system_prompt_v3 import LARRY_SYSTEM_PROMPT
+
+# uvloop is optional (not available on Windows): a faster event loop for batch_chat
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 # Load environment variables from .env file
 def load_env():
     """Load environment variables from .env file"""
     env_path = Path(__file__).parent / '.env'
     if env_path.exists():
-        with open(env_path) as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    os.environ[key.strip()] = value.strip()
+        # One read, then str.partition (a single C call) per line
+        for line in env_path.read_text().splitlines():
+            line = line.strip()
+            if not line or line[0] == '#':
+                continue
+            key, sep, value = line.partition('=')
+            if sep:
+                os.environ[key.strip()] = value.strip()
 
 load_env()
 
 # Configuration
 GOOGLE_AI_API_KEY = os.getenv('GOOGLE_AI_API_KEY')
-STORE_INFO_FILE = "larry_store_info.json"
+GEMINI_MODEL = "gemini-2.5-flash"
+EMPTY_MESSAGE_REPLY = "Please enter a question."
+CLI_FLUSH_INTERVAL = 0.032  # Seconds between terminal flushes while streaming
+MAX_HISTORY_TURNS = 20  # Turns kept in LarryNavigator.conversation_history (oldest evicted)
+HISTORY_PREVIEW_CHARS = 200  # Length of the stored answer preview shown by 'history'
+BATCH_MAX_CONCURRENCY = 8  # In-flight requests for chat_many/batch_chat (stay under rate limits)
+
+# Pre-baked replies for greetings, answered without classification, cache or model call
+_GREETING_REPLY = ("Hey! I'm Larry, your Uncertainty Navigator. Ask me about Problems Worth Solving, "
+                   "innovation frameworks, or the problem you're working on. Type 'help' for examples.")
+CANNED_REPLIES = {
+    greeting: _GREETING_REPLY
+    for greeting in ('hi', 'hello', 'hey', 'hi larry', 'hello larry', 'hey larry',
+                     'good morning', 'good afternoon', 'good evening')
+}
 
 if not GOOGLE_AI_API_KEY:
     print("✗ Error: GOOGLE_AI_API_KEY not found!")
@@ -37,120 +64,414 @@ if not GOOGLE_AI_API_KEY:
     print("\nGet your API key from: https://aistudio.google.com/apikey")
     sys.exit(1)
 
-# Larry's System Prompt (Aronhime Style)
-# Use the new comprehensive system prompt
-LARRY_SYSTEM_PROMPT = LARRY_SYSTEM_PROMPT_V3
+# Persona / question-type keyword tables, checked in priority order.
+# Keywords are stems matched at the start of a word, as in larry_heuristics:
+# "research" matches "researchers" and "recommend" matches "recommendations",
+# but "vs" no longer fires inside "devs". Plurals that change the stem are
+# listed explicitly.
+PERSONA_KEYWORDS = (
+    ('student', ('exam', 'test', 'study', 'studies', 'homework', 'assignment', 'course')),
+    ('entrepreneur', ('startup', 'validat', 'idea', 'market', 'customer')),
+    ('corporate', ('corporate', 'company', 'companies', 'team', 'organization', 'portfolio')),
+    ('consultant', ('client', 'workshop', 'facilitat', 'advis')),
+    ('researcher', ('research', 'theory', 'theories', 'literature', 'scholar')),
+)
+
+QUESTION_TYPE_PREFIXES = (
+    ('definitional', ('what is', 'what does', 'define', 'explain')),
+    ('how-to', ('how do i', 'how can i', 'steps to', 'process for')),
+)
+
+QUESTION_TYPE_KEYWORDS = (
+    ('comparison', ('vs', 'difference between', 'compar')),
+    ('example', ('example', 'case stud', 'show me', 'demonstrat')),
+    ('diagnostic', ('which type', 'is this', 'classif', 'what kind')),
+    ('application', ('how do i apply', 'use case', 'apply', 'appli')),
+    ('strategic', ('best approach', 'should i use', 'recommend', 'strateg')),
+    ('navigation', ('where can i', 'what lecture', 'where is')),
+)
+
+_WORD_RE = re.compile(r"[a-z]+")
+
+def _compile_prefixes(prefix_table):
+    """Compile every prefix bucket into one regex with a capture group per bucket
+
+    Used with .match(), so a single anchored scan returns the bucket whose
+    prefix starts the question (buckets keep their table order).
+    """
+    return re.compile('|'.join(
+        '(' + '|'.join(re.escape(prefix) for prefix in prefixes) + ')'
+        for _, prefixes in prefix_table
+    ))
+
+def _build_keyword_index(*tables):
+    """Index every keyword of every table by the (table, priority) buckets it belongs to
+
+    Returns (word -> buckets, phrase regex, phrase -> buckets). The phrase
+    regex uses a capturing lookahead so overlapping phrases are all reported,
+    and like single words a phrase only has to start on a word boundary.
+    """
+    word_buckets, phrase_buckets = {}, {}
+    for table_index, table in enumerate(tables):
+        for priority, (_, keywords) in enumerate(table):
+            for keyword in keywords:
+                buckets = phrase_buckets if ' ' in keyword else word_buckets
+                buckets.setdefault(keyword, []).append((table_index, priority))
+    phrases = sorted(phrase_buckets, key=len, reverse=True)
+    phrase_re = re.compile(r'(?=\b(' + '|'.join(map(re.escape, phrases)) + r'))')
+    return (
+        {word: tuple(buckets) for word, buckets in word_buckets.items()},
+        phrase_re,
+        {phrase: tuple(buckets) for phrase, buckets in phrase_buckets.items()},
+    )
+
+# Built once at import: one token pass + one regex scan finds every keyword of both tables
+_WORD_BUCKETS, _PHRASE_RE, _PHRASE_BUCKETS = _build_keyword_index(PERSONA_KEYWORDS, QUESTION_TYPE_KEYWORDS)
+# Word keyword lengths, shortest first: a token hits every keyword it starts with
+_KEYWORD_LENGTHS = tuple(sorted({len(word) for word in _WORD_BUCKETS}))
+_QUESTION_PREFIX_RE = _compile_prefixes(QUESTION_TYPE_PREFIXES)
+_QUESTION_PREFIX_LABELS = tuple(label for label, _ in QUESTION_TYPE_PREFIXES)
+
+# Keyword-table labels by priority; the extra last slot is the "no hit" fallback
+PERSONAS = tuple(label for label, _ in PERSONA_KEYWORDS) + ('general',)
+_KEYWORD_QUESTION_TYPES = tuple(label for label, _ in QUESTION_TYPE_KEYWORDS) + ('general',)
+QUESTION_TYPES = _QUESTION_PREFIX_LABELS + _KEYWORD_QUESTION_TYPES
+
+# Static prompt prefix + every persona x question-type context block, built once.
+# The full per-pair system prompt is joined only when a pair is first used.
+_PROMPT_PREFIX = LARRY_SYSTEM_PROMPT + "\n\n"
+_CONTEXT_TEMPLATE = (
+    "**Current Context:**\n"
+    "- Detected Persona: {persona}\n"
+    "- Question Type: {question_type}\n"
+    "\n"
+    "Adapt your response accordingly!"
+)
+_CONTEXT_BLOCKS = {
+    (persona, question_type): _CONTEXT_TEMPLATE.format_map({'persona': persona, 'question_type': question_type})
+    for persona in PERSONAS
+    for question_type in QUESTION_TYPES
+}
+
+@lru_cache(maxsize=512)
+def _classify(question_lower):
+    """Return (persona, question_type) for a stripped, lowercased question (cached)
+
+    Every keyword hit is collected in a single scan; each table then takes
+    its highest-priority (lowest index) bucket.
+    """
+    best = [len(PERSONA_KEYWORDS), len(QUESTION_TYPE_KEYWORDS)]
+    # Each distinct token is looked up once per keyword length (stem prefix)
+    for token in set(_WORD_RE.findall(question_lower)):
+        for length in _KEYWORD_LENGTHS:
+            if length > len(token):
+                break
+            for table_index, priority in _WORD_BUCKETS.get(token[:length], ()):
+                if priority < best[table_index]:
+                    best[table_index] = priority
+    for phrase in _PHRASE_RE.findall(question_lower):
+        for table_index, priority in _PHRASE_BUCKETS[phrase]:
+            if priority < best[table_index]:
+                best[table_index] = priority
+
+    prefix_match = _QUESTION_PREFIX_RE.match(question_lower)
+    if prefix_match:
+        question_type = _QUESTION_PREFIX_LABELS[prefix_match.lastindex - 1]
+    else:
+        question_type = _KEYWORD_QUESTION_TYPES[best[1]]
+    return PERSONAS[best[0]], question_type
+
+def _detect_persona(question_lower):
+    """Detect persona from a stripped, lowercased question"""
+    return _classify(question_lower)[0]
+
+def _classify_question_type(question_lower):
+    """Classify a stripped, lowercased question into one of 8 types"""
+    return _classify(question_lower)[1]
+
+def write_stream(chunks, out=None, flush_interval=CLI_FLUSH_INTERVAL):
+    """Write streamed text to the terminal, flushing on newlines or every flush_interval seconds
+
+    Flushing after every token costs one write syscall per chunk; batching
+    the flushes keeps the typewriter feel without that overhead.
+    """
+    out = out or sys.stdout
+    last_flush = time.monotonic()
+    for chunk in chunks:
+        out.write(chunk)
+        now = time.monotonic()
+        if '\n' in chunk or now - last_flush >= flush_interval:
+            out.flush()
+            last_flush = now
+    out.write('\n')
+    out.flush()
+
+class Turn:
+    """One answered question in LarryNavigator.conversation_history
+
+    __slots__ keeps each turn much smaller than a dict and gives plain
+    attribute access.
+    """
+    __slots__ = ('user', 'assistant', 'assistant_preview', 'persona', 'question_type', 'timestamp')
+
+    def __init__(self, user, assistant, persona, question_type):
+        self.user = user
+        self.assistant = assistant
+        self.assistant_preview = assistant[:HISTORY_PREVIEW_CHARS]  # cut once, not per display
+        self.persona = persona
+        self.question_type = question_type
+        self.timestamp = time.time()
+
+    def __repr__(self):
+        return f"Turn(user={self.user!r}, persona={self.persona!r}, question_type={self.question_type!r})"
+
+def print_banner():
+    """Print the CLI welcome banner"""
+    print("=" * 80)
+    print("🎯 LARRY - YOUR PERSONAL UNCERTAINTY NAVIGATOR")
+    print("=" * 80)
+    print()
+    print("Hey there! I'm Larry, and I teach the way Professor Aronhime does:")
+    print("  → I start with questions, not answers")
+    print("  → I challenge your thinking")
+    print("  → I use stories you'll remember")
+    print("  → I give you frameworks, not just facts")
+    print()
+    print("I know all about Problems Worth Solving, innovation frameworks,")
+    print("un-defined/ill-defined/well-defined problems, and how to navigate uncertainty.")
+    print()
+    print("Type 'exit' or 'quit' to leave. Type 'help' for example questions, 'history' to review this session.")
+    print("=" * 80)
+    print()
 
 class LarryNavigator:
     def __init__(self, api_key, store_info_file):
-        self.client = genai.Client(api_key=api_key)
+        # Import the Gemini SDK lazily: it is heavy and only needed once we chat
+        from google.genai import types
+        self._types = types
+
+        self.client = get_client(api_key)
         self.store_info = self.load_store_info(store_info_file)
-        self.conversation_history = []
+        self.conversation_history = deque(maxlen=MAX_HISTORY_TURNS)
+        self._file_search_tools = [
+            types.Tool(
+                file_search=types.FileSearch(
+                    file_search_store_names=[self.store_info['store_name']]
+                )
+            )
+        ]
+        self._generation_configs = {}
+        self._cached_config = None
+        self._cached_config_name = None
+        self.response_cache = SemanticCache(self.client)
+
+    def _get_generation_config(self, persona, question_type):
+        """Return the (cached) generation config for a persona/question-type pair"""
+        key = (persona, question_type)
+        config = self._generation_configs.get(key)
+        if config is None:
+            config = self._types.GenerateContentConfig(
+                system_instruction=_PROMPT_PREFIX + _CONTEXT_BLOCKS[key],
+                tools=self._file_search_tools,
+                temperature=0.7,
+                top_p=0.95,
+            )
+            self._generation_configs[key] = config
+        return config
+
+    def _request(self, user_message, persona, question_type):
+        """Return (contents, config) for a classified message
+
+        When LARRY_SYSTEM_PROMPT is held in a Gemini context cache (uploaded
+        once per hour and shared by every request), one config references it
+        and only the small persona/type context block travels with the
+        message. Otherwise the full enhanced prompt is sent as system_instruction.
+        """
+        cache_name = get_prompt_cache(self.client, GEMINI_MODEL, LARRY_SYSTEM_PROMPT,
+                                      self._file_search_tools, cache_key=self.store_info['store_name'])
+        if not cache_name:
+            return user_message, self._get_generation_config(persona, question_type)
+
+        if cache_name != self._cached_config_name:
+            self._cached_config = self._types.GenerateContentConfig(
+                cached_content=cache_name,
+                temperature=0.7,
+                top_p=0.95,
+            )
+            self._cached_config_name = cache_name
+        return f"{_CONTEXT_BLOCKS[(persona, question_type)]}\n\n{user_message}", self._cached_config
 
     def load_store_info(self, filename):
         """Load File Search store information"""
-        try:
-            with open(filename, 'r') as f:
-                return json.load(f)
-        except FileNotFoundError:
+        store_info = load_store_info(filename)
+        if not store_info:
             print(f"✗ Error: {filename} not found. Run build_larry_navigator.py first!")
             sys.exit(1)
+        return store_info
 
     def detect_persona(self, question):
         """Detect user persona from question"""
-        question_lower = question.lower()
-
-        if any(word in question_lower for word in ['exam', 'test', 'study', 'homework', 'assignment', 'course']):
-            return 'student'
-        elif any(word in question_lower for word in ['startup', 'validate', 'idea', 'market', 'customer']):
-            return 'entrepreneur'
-        elif any(word in question_lower for word in ['corporate', 'company', 'team', 'organization', 'portfolio']):
-            return 'corporate'
-        elif any(word in question_lower for word in ['client', 'workshop', 'facilitate', 'advise']):
-            return 'consultant'
-        elif any(word in question_lower for word in ['research', 'theory', 'literature', 'scholar']):
-            return 'researcher'
-        else:
-            return 'general'
+        return _detect_persona(question.strip().lower())
 
     def classify_question_type(self, question):
         """Classify question into one of 8 types"""
-        question_lower = question.lower()
-
-        if question.startswith(('what is', 'what does', 'define', 'explain')):
-            return 'definitional'
-        elif question.startswith(('how do i', 'how can i', 'steps to', 'process for')):
-            return 'how-to'
-        elif 'vs' in question_lower or 'difference between' in question_lower or 'compare' in question_lower:
-            return 'comparison'
-        elif any(word in question_lower for word in ['example', 'case study', 'show me', 'demonstrate']):
-            return 'example'
-        elif any(word in question_lower for word in ['which type', 'is this', 'classify', 'what kind']):
-            return 'diagnostic'
-        elif any(word in question_lower for word in ['how do i apply', 'use case', 'apply']):
-            return 'application'
-        elif any(word in question_lower for word in ['best approach', 'should i use', 'recommend', 'strategy']):
-            return 'strategic'
-        elif any(word in question_lower for word in ['where can i', 'what lecture', 'where is']):
-            return 'navigation'
-        else:
-            return 'general'
+        return _classify_question_type(question.strip().lower())
+
+    def _classify(self, user_message):
+        """Return (persona, question_type) for a message"""
+        return _classify(user_message.strip().lower())
+
+    def _record_turn(self, user_message, persona, question_type, response_text):
+        """Append a completed turn to the (bounded) conversation history"""
+        self.conversation_history.append(Turn(user_message, response_text, persona, question_type))
+
+    @staticmethod
+    def _response_text(response):
+        """Extract response text, or a fallback if Gemini returned nothing"""
+        if response and response.text:
+            return response.text
+        return "I'm sorry, I couldn't generate a response. Could you rephrase your question?"
+
+    def _cached_reply(self, user_message):
+        """Answer a message without Gemini where possible (every chat path starts here)
+
+        Returns (reply, persona, question_type, embedding). reply is the
+        empty-message, canned or cached answer, or None when Gemini has to be
+        called; persona is None for empty and canned messages. Pass the
+        embedding to response_cache.put() on a miss.
+        """
+        if not user_message.strip():
+            return EMPTY_MESSAGE_REPLY, None, None, None
+
+        canned = CANNED_REPLIES.get(normalize_question(user_message))
+        if canned:
+            return canned, None, None, None
+
+        # Repeated / near-duplicate questions are answered from the response cache
+        persona, question_type = self._classify(user_message)
+        cached, embedding = self.response_cache.get(persona, question_type, user_message)
+        return cached, persona, question_type, embedding
 
     def chat(self, user_message):
         """Chat with Larry using File Search"""
-        # Detect persona and question type
-        persona = self.detect_persona(user_message)
-        question_type = self.classify_question_type(user_message)
+        reply, persona, question_type, embedding = self._cached_reply(user_message)
+        if reply is not None:
+            if persona is not None:
+                self._record_turn(user_message, persona, question_type, reply)
+            return reply
 
-        # Add context to system prompt
-        enhanced_prompt = f"{LARRY_SYSTEM_PROMPT}\n\n**Current Context:**\n- Detected Persona: {persona}\n- Question Type: {question_type}\n\nAdapt your response accordingly!"
+        contents, config = self._request(user_message, persona, question_type)
 
         # Build conversation with File Search
         try:
             response = self.client.models.generate_content(
-                model="gemini-2.5-flash",
-                contents=user_message,
-                config=types.GenerateContentConfig(
-                    system_instruction=enhanced_prompt,
-                    tools=[
-                        types.Tool(
-                            file_search=types.FileSearch(
-                                file_search_store_names=[self.store_info['store_name']]
-                            )
-                        )
-                    ],
-                    temperature=0.7,
-                    top_p=0.95,
-                )
+                model=GEMINI_MODEL,
+                contents=contents,
+                config=config
             )
-
-            # Extract response text
             if response and response.text:
-                return response.text
+                self.response_cache.put(persona, question_type, user_message, response.text, embedding)
+                self._record_turn(user_message, persona, question_type, response.text)
+            return self._response_text(response)
+
+        except Exception as e:
+            return f"Error communicating with Larry: {e}"
+
+    def chat_stream(self, user_message):
+        """Chat with Larry using File Search, yielding text as Gemini streams it"""
+        reply, persona, question_type, embedding = self._cached_reply(user_message)
+        if reply is not None:
+            if persona is not None:
+                self._record_turn(user_message, persona, question_type, reply)
+            yield reply
+            return
+
+        contents, config = self._request(user_message, persona, question_type)
+
+        parts = []
+        try:
+            stream = self.client.models.generate_content_stream(
+                model=GEMINI_MODEL,
+                contents=contents,
+                config=config
+            )
+            for chunk in stream:
+                if chunk.text:
+                    parts.append(chunk.text)
+                    yield chunk.text
+
+        except Exception as e:
+            if not parts:
+                yield f"Error communicating with Larry: {e}"
+                return
+            # Connection dropped mid-answer: keep the partial text in history (not in the cache)
+            self._record_turn(user_message, persona, question_type, ''.join(parts))
+            yield f"\n\n[Response interrupted: {e}]"
+            return
+
+        if not parts:
+            yield self._response_text(None)
+            return
+
+        # History is appended once the stream completes; only complete responses are cached
+        response_text = ''.join(parts)
+        self.response_cache.put(persona, question_type, user_message, response_text, embedding)
+        self._record_turn(user_message, persona, question_type, response_text)
+
+    async def achat(self, user_message, semaphore=None):
+        """Async chat via the async Gemini client (does not block the event loop)
+
+        Pass a shared asyncio.Semaphore to cap how many requests are in
+        flight when many achat() calls run concurrently (see chat_many).
+        Canned replies and the response cache apply as in chat(). The cache
+        lookup may embed the question and _request() may create the prompt
+        cache, so both run in worker threads.
+        """
+        reply, persona, question_type, embedding = await asyncio.to_thread(self._cached_reply, user_message)
+        if reply is not None:
+            return reply
+
+        contents, config = await asyncio.to_thread(self._request, user_message, persona, question_type)
+        try:
+            if semaphore is None:
+                response = await self.client.aio.models.generate_content(
+                    model=GEMINI_MODEL,
+                    contents=contents,
+                    config=config
+                )
             else:
-                return "I'm sorry, I couldn't generate a response. Could you rephrase your question?"
+                async with semaphore:
+                    response = await self.client.aio.models.generate_content(
+                        model=GEMINI_MODEL,
+                        contents=contents,
+                        config=config
+                    )
+            if response and response.text:
+                self.response_cache.put(persona, question_type, user_message, response.text, embedding)
+            return self._response_text(response)
 
         except Exception as e:
             return f"Error communicating with Larry: {e}"
 
-    def run_cli(self):
+    async def chat_many(self, messages, max_concurrency=BATCH_MAX_CONCURRENCY):
+        """Answer many independent messages concurrently, results in input order
+
+        At most max_concurrency requests are in flight (stays under Gemini
+        rate limits). Errors are returned inline, as chat() does.
+        Conversation history is not used.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        return list(await asyncio.gather(*(self.achat(message, semaphore) for message in messages)))
+
+    def batch_chat(self, messages, max_concurrency=BATCH_MAX_CONCURRENCY):
+        """Blocking wrapper around chat_many() (offline evaluation / bulk runs)"""
+        run = uvloop.run if uvloop is not None else asyncio.run
+        return run(self.chat_many(messages, max_concurrency))
+
+    def run_cli(self, show_banner=True):
         """Run interactive CLI"""
-        print("=" * 80)
-        print("🎯 LARRY - YOUR PERSONAL UNCERTAINTY NAVIGATOR")
-        print("=" * 80)
-        print()
-        print("Hey there! I'm Larry, and I teach the way Professor Aronhime does:")
-        print("  → I start with questions, not answers")
-        print("  → I challenge your thinking")
-        print("  → I use stories you'll remember")
-        print("  → I give you frameworks, not just facts")
-        print()
-        print("I know all about Problems Worth Solving, innovation frameworks,")
-        print("un-defined/ill-defined/well-defined problems, and how to navigate uncertainty.")
-        print()
-        print("Type 'exit' or 'quit' to leave. Type 'help' for example questions.")
-        print("=" * 80)
-        print()
+        if show_banner:
+            print_banner()
 
         while True:
             try:
@@ -167,10 +488,13 @@ class LarryNavigator:
                     self.show_help()
                     continue
 
+                if user_input.lower() == 'history':
+                    self.show_history()
+                    continue
+
                 # Chat with Larry
                 print("\n🎓 Larry: ", end='', flush=True)
-                response = self.chat(user_input)
-                print(response)
+                write_stream(self.chat_stream(user_input))
 
             except KeyboardInterrupt:
                 print("\n\n👋 Larry: Interrupted! Come back anytime.")
@@ -178,6 +502,16 @@ class LarryNavigator:
             except Exception as e:
                 print(f"\n✗ Error: {e}")
 
+    def show_history(self):
+        """Show the questions and answer previews from this session"""
+        if not self.conversation_history:
+            print("\n(No questions yet this session.)")
+            return
+        print("\n" + "\n\n".join(
+            f"{i}. 💬 {turn.user}\n   🎓 {turn.assistant_preview}"
+            for i, turn in enumerate(self.conversation_history, 1)
+        ))
+
     def show_help(self):
         """Show example questions"""
         print("\n" + "=" * 80)
@@ -206,11 +540,13 @@ class LarryNavigator:
         print("=" * 80)
 
 def main():
+    # Show the banner first; creating the navigator loads the Gemini SDK
+    print_banner()
     larry = LarryNavigator(
         api_key=GOOGLE_AI_API_KEY,
         store_info_file=STORE_INFO_FILE
     )
-    larry.run_cli()
+    larry.run_cli(show_banner=False)
 
 if __name__ == "__main__":
     main()
@@ -8,16 +8,31 @@ CLAUDE_MODEL = "claude-sonnet-4-20250514"
 CLAUDE_MAX_TOKENS = 8192
 CLAUDE_TEMPERATURE_DEFAULT = 0.2
 CLAUDE_TEMPERATURE_PRECISE = 0.0  # For Cypher generation
+GEMINI_HTTP_TIMEOUT_MS = 60000  # Per-request timeout for the shared Gemini client
+PROMPT_CACHE_MIN_CHARS = 8000  # System prompts at least this long go into a Gemini context cache
+PROMPT_CACHE_TTL_SECONDS = 3600
 
 # --- RAG Configuration ---
 WEB_SEARCH_DEFAULT_RESULTS = 5
 WEB_SEARCH_DATE_FILTER_YEARS = 3
 NEO4J_DEFAULT_DATABASE = "neo4j"
+GRAPH_EMBEDDING_MODEL = "models/text-embedding-004"  # Embeds Framework/Concept nodes and questions for vector search
+GRAPH_EMBEDDING_DIMENSIONS = 768  # Must match the Neo4j vector indexes
+EMBEDDING_BATCH_SIZE = 100  # Gemini embed_content accepts at most 100 texts per request
 
 # --- UI Configuration ---
 CLARITY_BASE_SCORE = 20
 CLARITY_INCREMENT_PER_MESSAGE = 5
 CLARITY_READY_THRESHOLD = 70
 
+# --- Response Cache Configuration ---
+SEMANTIC_CACHE_THRESHOLD = 0.93  # Cosine similarity for a near-duplicate question to reuse an answer
+SEMANTIC_CACHE_MAX_ENTRIES = 256
+SEMANTIC_CACHE_EMBEDDING_MODEL = "models/text-embedding-004"
+EMBEDDING_CACHE_MAX_ENTRIES = 1024  # Question embeddings shared by the response cache and vector search
+NEO4J_RESULT_CACHE_MAX_ENTRIES = 512  # Per LarryNeo4jRAG, for query results and formatted contexts
+NEO4J_RESULT_CACHE_TTL_SECONDS = 300  # Graph edits show up after at most this long
+NEO4J_SCHEMA_CACHE_TTL_SECONDS = 300  # get_neo4j_schema() re-introspects the graph at most this often
+
 # --- Memory Configuration ---
 CONVERSATION_MEMORY_WINDOW = 5  # Number of exchanges to remember
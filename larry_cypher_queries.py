@@ -3,6 +3,27 @@ Larry Navigator - Cypher Query Library
 Pre-built, optimized Cypher queries for different question types and scenarios
 """
 
+import json
+import os
+import re
+import sys
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import product
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+from larry_config import NEO4J_RESULT_CACHE_MAX_ENTRIES, NEO4J_RESULT_CACHE_TTL_SECONDS
+
+# Aho-Corasick is optional: one automaton walk finds any of many framework names
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 # ============================================================================
 # QUERY LIBRARY - Organized by Use Case
 # ============================================================================
@@ -16,45 +37,58 @@ CYPHER_QUERIES = {
     "find_frameworks_by_problem_type": """
         // Find frameworks suitable for a specific problem type
         MATCH (f:Framework)-[:ADDRESSES]->(pt:ProblemType {name: $problem_type})
-        OPTIONAL MATCH (a:Author)-[:CREATED]->(f)
+        CALL {
+            WITH f
+            MATCH (a:Author)-[:CREATED]->(f)
+            RETURN collect(DISTINCT a.name) AS authors
+        }
         RETURN
             f.name AS framework,
             f.description AS description,
             f.difficulty AS difficulty,
             f.time_required AS time_required,
             f.team_size AS team_size,
-            collect(DISTINCT a.name) AS authors
-        ORDER BY
-            CASE f.difficulty
-                WHEN 'BEGINNER' THEN 1
-                WHEN 'INTERMEDIATE' THEN 2
-                WHEN 'ADVANCED' THEN 3
-            END
+            authors
+        ORDER BY f.difficulty_rank
         LIMIT 5
     """,
 
     "find_frameworks_by_persona": """
         // Find frameworks recommended for a specific persona
         MATCH (p:Persona {name: $persona})-[:USES]->(f:Framework)
-        OPTIONAL MATCH (f)-[:ADDRESSES]->(pt:ProblemType)
+        CALL {
+            WITH f
+            MATCH (f)-[:ADDRESSES]->(pt:ProblemType)
+            RETURN collect(DISTINCT pt.name) AS problem_types
+        }
         RETURN
             f.name AS framework,
             f.description AS description,
             f.difficulty AS difficulty,
-            collect(DISTINCT pt.name) AS problem_types
-        ORDER BY f.difficulty
+            problem_types
+        ORDER BY f.difficulty_rank
         LIMIT 5
     """,
 
+    "list_framework_names": """
+        // Catalog of framework names for the question router
+        MATCH (f:Framework)
+        RETURN f.name AS name
+    """,
+
     "find_beginner_frameworks": """
         // Find beginner-friendly frameworks
         MATCH (f:Framework {difficulty: 'BEGINNER'})
-        OPTIONAL MATCH (f)-[:ADDRESSES]->(pt:ProblemType)
+        CALL {
+            WITH f
+            MATCH (f)-[:ADDRESSES]->(pt:ProblemType)
+            RETURN collect(DISTINCT pt.name) AS suitable_for
+        }
         RETURN
             f.name AS framework,
             f.description AS description,
             f.time_required AS time_required,
-            collect(DISTINCT pt.name) AS suitable_for
+            suitable_for
         ORDER BY f.time_required
         LIMIT 5
     """,
@@ -111,26 +145,48 @@ CYPHER_QUERIES = {
 
     "search_concepts_by_keyword": """
         // Full-text search across concepts
-        CALL db.index.fulltext.queryNodes('concept_search', $search_term)
+        CALL db.index.fulltext.queryNodes('concept_search', $search_term, {limit: 5})
         YIELD node, score
-        MATCH (node:Concept)
-        OPTIONAL MATCH (node)-[:RELATED_TO]-(related:Concept)
-        OPTIONAL MATCH (node)-[:USED_IN]->(f:Framework)
+        // LIMIT inside each subquery stops expanding hub concepts after 3 names
+        CALL {
+            WITH node
+            MATCH (node)-[:RELATED_TO]-(related:Concept)
+            WITH DISTINCT related.name AS name
+            LIMIT 3
+            RETURN collect(name) AS related_concepts
+        }
+        CALL {
+            WITH node
+            MATCH (node)-[:USED_IN]->(f:Framework)
+            WITH DISTINCT f.name AS name
+            LIMIT 3
+            RETURN collect(name) AS used_in_frameworks
+        }
         RETURN
             node.name AS concept,
             node.description AS description,
-            collect(DISTINCT related.name)[..3] AS related_concepts,
-            collect(DISTINCT f.name)[..3] AS used_in_frameworks,
+            related_concepts,
+            used_in_frameworks,
             score
         ORDER BY score DESC
         LIMIT 5
     """,
 
+    "vector_concept_search": """
+        // Embedding (ANN) search across concepts via the HNSW vector index
+        CALL db.index.vector.queryNodes('concept_embeddings', 5, $query_embedding)
+        YIELD node, score
+        RETURN
+            node.name AS concept,
+            node.description AS description,
+            score
+    """,
+
     "find_document_chunks": """
         // Find relevant document chunks by content
-        CALL db.index.fulltext.queryNodes('document_search', $search_term)
+        // The procedure yields hits best-first and stops after the limit
+        CALL db.index.fulltext.queryNodes('document_search', $search_term, {limit: 3})
         YIELD node, score
-        MATCH (node:DocumentChunk)
         RETURN
             node.chunk_id AS chunk_id,
             node.content AS content,
@@ -139,8 +195,6 @@ CYPHER_QUERIES = {
             node.frameworks AS frameworks,
             node.problem_types AS problem_types,
             score
-        ORDER BY score DESC
-        LIMIT 3
     """,
 
     # ========================================================================
@@ -148,32 +202,42 @@ CYPHER_QUERIES = {
     # ========================================================================
 
     "find_authors_by_expertise": """
-        // Find authors by expertise area
-        MATCH (a:Author)
-        WHERE a.expertise CONTAINS $expertise
+        // Find authors by expertise area (Lucene query syntax)
+        CALL db.index.fulltext.queryNodes('author_expertise_search', $expertise)
+        YIELD node AS a, score
         OPTIONAL MATCH (a)-[:WROTE]->(b:Book)
         OPTIONAL MATCH (a)-[:CREATED]->(f:Framework)
         RETURN
             a.name AS author,
             a.expertise AS expertise,
             a.books AS books,
-            collect(DISTINCT f.name) AS frameworks
+            collect(DISTINCT f.name) AS frameworks,
+            score
+        ORDER BY score DESC
         LIMIT 5
     """,
 
     "get_book_information": """
-        // Get information about a specific book
-        MATCH (b:Book)
-        WHERE b.title CONTAINS $book_title
+        // Get information about a specific book (Lucene query syntax)
+        CALL db.index.fulltext.queryNodes('book_title_search', $book_title)
+        YIELD node AS b, score
+        CALL {
+            WITH b
+            MATCH (b)-[:DISCUSSES]->(c:Concept)
+            WITH DISTINCT c.name AS name
+            LIMIT 5
+            RETURN collect(name) AS key_concepts
+        }
         OPTIONAL MATCH (a:Author)-[:WROTE]->(b)
-        OPTIONAL MATCH (b)-[:DISCUSSES]->(c:Concept)
         OPTIONAL MATCH (b)-[:INTRODUCES]->(f:Framework)
         RETURN
             b.title AS title,
             a.name AS author,
             b.publication_year AS year,
-            collect(DISTINCT c.name)[..5] AS key_concepts,
-            collect(DISTINCT f.name) AS frameworks
+            key_concepts,
+            collect(DISTINCT f.name) AS frameworks,
+            score
+        ORDER BY score DESC
         LIMIT 1
     """,
 
@@ -183,12 +247,7 @@ CYPHER_QUERIES = {
 
     "get_portfolio_horizon_frameworks": """
         // Find frameworks suitable for a portfolio horizon
-        MATCH (h:PortfolioHorizon {name: $horizon})
-        MATCH (pt:ProblemType)<-[:ADDRESSES]-(f:Framework)
-        WHERE
-            (h.name = 'Now' AND pt.name = 'Well-Defined') OR
-            (h.name = 'New' AND pt.name = 'Ill-Defined') OR
-            (h.name = 'Next' AND pt.name IN ['Undefined', 'Ill-Defined'])
+        MATCH (h:PortfolioHorizon {name: $horizon})-[:MAPS_TO]->(pt:ProblemType)<-[:ADDRESSES]-(f:Framework)
         RETURN
             h.name AS horizon,
             h.resource_allocation AS allocation,
@@ -206,13 +265,9 @@ CYPHER_QUERIES = {
             h.description AS description,
             h.resource_allocation AS recommended_allocation,
             h.time_frame AS timeframe,
+            h.rank AS horizon_rank,
             collect(DISTINCT f.name) AS example_frameworks
-        ORDER BY
-            CASE h.name
-                WHEN 'Now' THEN 1
-                WHEN 'New' THEN 2
-                WHEN 'Next' THEN 3
-            END
+        ORDER BY horizon_rank
     """,
 
     # ========================================================================
@@ -223,32 +278,37 @@ CYPHER_QUERIES = {
         // Generate a learning path for a specific persona
         MATCH (p:Persona {name: $persona})-[:USES]->(f:Framework)
         MATCH (f)-[:ADDRESSES]->(pt:ProblemType)
-        WITH f, pt, p,
-            CASE f.difficulty
-                WHEN 'BEGINNER' THEN 1
-                WHEN 'INTERMEDIATE' THEN 2
-                WHEN 'ADVANCED' THEN 3
-            END AS difficulty_order
         RETURN
             f.name AS framework,
             f.difficulty AS level,
             f.description AS description,
             pt.name AS problem_type,
             f.time_required AS time_commitment
-        ORDER BY difficulty_order, f.time_required
+        ORDER BY f.difficulty_rank, f.time_required
         LIMIT 5
     """,
 
     "prerequisite_frameworks": """
-        // Find prerequisite or foundational frameworks
+        // Find prerequisite or foundational frameworks (bounded BFS, each node visited once)
         MATCH (f:Framework {name: $framework_name})
-        MATCH path = (prereq:Framework)-[:BUILDS_ON|REQUIRES*1..2]->(f)
+        CALL apoc.path.expandConfig(f, {
+            relationshipFilter: '<BUILDS_ON|<REQUIRES',
+            labelFilter: '+Framework',
+            minLevel: 1,
+            maxLevel: 2,
+            uniqueness: 'NODE_GLOBAL',
+            bfs: true,
+            limit: 20
+        })
+        YIELD path
+        WITH last(nodes(path)) AS prereq, length(path) AS steps_away
         RETURN
             prereq.name AS prerequisite,
             prereq.description AS description,
             prereq.difficulty AS difficulty,
-            length(path) AS steps_away
-        ORDER BY steps_away, prereq.difficulty
+            steps_away
+        ORDER BY steps_away, prereq.difficulty_rank
+        LIMIT 20
     """,
 
     # ========================================================================
@@ -307,9 +367,8 @@ CYPHER_QUERIES = {
 
     "semantic_framework_search": """
         // Semantic search across frameworks
-        CALL db.index.fulltext.queryNodes('framework_search', $search_query)
+        CALL db.index.fulltext.queryNodes('framework_search', $search_query, {limit: 5})
         YIELD node, score
-        MATCH (node:Framework)
         OPTIONAL MATCH (node)-[:ADDRESSES]->(pt:ProblemType)
         OPTIONAL MATCH (p:Persona)-[:USES]->(node)
         RETURN
@@ -323,6 +382,22 @@ CYPHER_QUERIES = {
         LIMIT 5
     """,
 
+    "vector_framework_search": """
+        // Embedding (ANN) search across frameworks via the HNSW vector index
+        CALL db.index.vector.queryNodes('framework_embeddings', 5, $query_embedding)
+        YIELD node, score
+        OPTIONAL MATCH (node)-[:ADDRESSES]->(pt:ProblemType)
+        OPTIONAL MATCH (p:Persona)-[:USES]->(node)
+        RETURN
+            node.name AS framework,
+            node.description AS description,
+            node.difficulty AS difficulty,
+            collect(DISTINCT pt.name) AS problem_types,
+            collect(DISTINCT p.name) AS personas,
+            score
+        ORDER BY score DESC
+    """,
+
     # ========================================================================
     # 9. DIAGNOSTIC QUERIES
     # ========================================================================
@@ -330,18 +405,12 @@ CYPHER_QUERIES = {
     "diagnose_problem_and_recommend": """
         // Comprehensive diagnostic based on user context
         // Parameters: $keywords (list), $time_horizon, $persona
-        MATCH (pt:ProblemType)
-        WHERE pt.time_horizon = $time_horizon
-
-        MATCH (f:Framework)-[:ADDRESSES]->(pt)
-        MATCH (p:Persona {name: $persona})-[:USES]->(f)
-
-        WITH f, pt, p,
-            CASE f.difficulty
-                WHEN 'BEGINNER' THEN 1
-                WHEN 'INTERMEDIATE' THEN 2
-                WHEN 'ADVANCED' THEN 3
-            END AS difficulty_score
+        // Seeded from the single Persona node, then narrowed to the horizon
+        MATCH (p:Persona {name: $persona})
+        USING INDEX p:Persona(name)
+        MATCH (p)-[:USES]->(f:Framework)
+        WITH p, f
+        MATCH (f)-[:ADDRESSES]->(pt:ProblemType {time_horizon: $time_horizon})
 
         RETURN
             pt.name AS problem_type,
@@ -352,7 +421,7 @@ CYPHER_QUERIES = {
             f.difficulty AS difficulty,
             f.time_required AS time_required,
             pt.tools AS alternative_tools
-        ORDER BY difficulty_score
+        ORDER BY f.difficulty_rank
         LIMIT 3
     """,
 
@@ -362,12 +431,36 @@ CYPHER_QUERIES = {
 
     "enrich_response_with_context": """
         // Get rich context for a framework to enrich responses
+        // Each neighbourhood is collected in its own subquery, so the row
+        // streams are summed rather than multiplied into a cartesian product
         MATCH (f:Framework {name: $framework_name})
-        OPTIONAL MATCH (f)-[:ADDRESSES]->(pt:ProblemType)
-        OPTIONAL MATCH (p:Persona)-[:USES]->(f)
-        OPTIONAL MATCH (a:Author)-[:CREATED]->(f)
-        OPTIONAL MATCH (f)-[rel:COMPLEMENTS|BUILDS_ON]-(related:Framework)
-        OPTIONAL MATCH (cs:CaseStudy)-[:DEMONSTRATES]->(f)
+        CALL {
+            WITH f
+            MATCH (f)-[:ADDRESSES]->(pt:ProblemType)
+            RETURN
+                collect(DISTINCT pt.name) AS addresses_problem_types,
+                collect(DISTINCT pt.characteristics) AS problem_characteristics
+        }
+        CALL {
+            WITH f
+            MATCH (p:Persona)-[:USES]->(f)
+            RETURN collect(DISTINCT p.name) AS used_by_personas
+        }
+        CALL {
+            WITH f
+            MATCH (a:Author)-[:CREATED]->(f)
+            RETURN collect(DISTINCT a.name) AS created_by
+        }
+        CALL {
+            WITH f
+            MATCH (f)-[rel:COMPLEMENTS|BUILDS_ON]-(related:Framework)
+            RETURN collect(DISTINCT {name: related.name, relationship: type(rel)}) AS related_frameworks
+        }
+        CALL {
+            WITH f
+            MATCH (cs:CaseStudy)-[:DEMONSTRATES]->(f)
+            RETURN collect(DISTINCT cs.title)[..2] AS example_cases
+        }
 
         RETURN
             f.name AS framework,
@@ -375,15 +468,53 @@ CYPHER_QUERIES = {
             f.difficulty AS difficulty,
             f.time_required AS time_required,
             f.team_size AS team_size,
-            collect(DISTINCT pt.name) AS addresses_problem_types,
-            collect(DISTINCT pt.characteristics) AS problem_characteristics,
-            collect(DISTINCT p.name) AS used_by_personas,
-            collect(DISTINCT a.name) AS created_by,
-            collect(DISTINCT {name: related.name, relationship: type(rel)}) AS related_frameworks,
-            collect(DISTINCT cs.title)[..2] AS example_cases
+            addresses_problem_types,
+            problem_characteristics,
+            used_by_personas,
+            created_by,
+            related_frameworks,
+            example_cases
     """
 }
 
+# Opt-in runtime for the library's read-only queries (e.g. "pipelined" on
+# Neo4j Enterprise / Aura, which also compiles the expressions of
+# COMPILED_EXPRESSION_QUERIES). Unset, queries use the server's default
+# runtime, which every edition supports
+CYPHER_RUNTIME = os.getenv("NEO4J_CYPHER_RUNTIME", "")
+
+# Open-text searches whose best plan varies with the search term: let the
+# planner replan them instead of pinning the first cached plan
+REPLANNED_QUERIES = frozenset({"search_concepts_by_keyword", "semantic_framework_search"})
+
+# Queries whose ORDER BY / projection expressions are worth compiling
+COMPILED_EXPRESSION_QUERIES = frozenset({"diagnose_problem_and_recommend"})
+
+
+def _query_options(name: str) -> str:
+    """CYPHER pre-parser options prepended to a library query."""
+    options = []
+    if CYPHER_RUNTIME:
+        options.append(f"runtime={CYPHER_RUNTIME}")
+        if name in COMPILED_EXPRESSION_QUERIES:
+            options.append("expressionEngine=COMPILED")
+    if name not in REPLANNED_QUERIES:
+        options.append("replan=skip")
+    return f"CYPHER {' '.join(options)}" if options else ""
+
+
+# Frozen at import with one interned string per query, so every run sends the
+# identical query text and Neo4j's query plan cache keeps hitting
+CYPHER_QUERIES = MappingProxyType({
+    name: sys.intern(_query_options(name) + query) for name, query in CYPHER_QUERIES.items()
+})
+
+# Parameter names each query expects (from its $placeholders, comments ignored)
+QUERY_PARAMETERS = MappingProxyType({
+    name: frozenset(re.findall(r"\$(\w+)", re.sub(r"//[^\n]*", "", query)))
+    for name, query in CYPHER_QUERIES.items()
+})
+
 
 # ============================================================================
 # QUERY PARAMETER TEMPLATES
@@ -402,6 +533,14 @@ PARAMETER_TEMPLATES = {
     "get_portfolio_horizon_frameworks": {
         "horizon": ["Now", "New", "Next"]
     },
+    # Fulltext-backed: values are Lucene queries, so quoted phrases, OR and
+    # trailing wildcards work
+    "find_authors_by_expertise": {
+        "expertise": ["Disruptive Innovation", '"Lean Startup"', "Business Model*"]
+    },
+    "get_book_information": {
+        "book_title": ['"The Lean Startup"', "Innovator*", "Blue Ocean OR Three Box"]
+    },
     "find_by_multiple_criteria": {
         "difficulty": ["BEGINNER", "INTERMEDIATE", "ADVANCED"],
         "time_constraint": ["1-2 weeks", "2-4 weeks", "2-3 months", "3-6 months"],
@@ -410,15 +549,116 @@ PARAMETER_TEMPLATES = {
     }
 }
 
+PARAMETER_TEMPLATES = MappingProxyType({
+    name: MappingProxyType({param: tuple(values) for param, values in params.items()})
+    for name, params in PARAMETER_TEMPLATES.items()
+})
+
 
 # ============================================================================
 # QUERY SELECTOR - Smart Query Selection
 # ============================================================================
 
+# Trigger phrases per question intent, in priority order
+INTENT_TRIGGERS = (
+    ("framework_discovery", ("which framework", "what framework", "recommend framework")),
+    ("classification", ("what type of problem", "classify", "problem type")),
+    ("related", ("related to", "similar to", "complements")),
+    ("learning_path", ("learning path", "where to start", "progression")),
+    ("portfolio", ("portfolio", "now new next", "three box")),
+    ("case_study", ("example", "case study", "real world")),
+)
+
+KNOWN_FRAMEWORKS = ("Design Thinking", "Jobs-to-be-Done", "Blue Ocean", "Lean Startup")
+
+# Single-word triggers are matched against the question's token set (with
+# common inflections, e.g. "examples"); one set test per intent
+_TRIGGER_SUFFIXES = ("", "s", "es", "ed", "ing")
+_TOKEN_RE = re.compile(r"[a-z]+")
+_INTENT_WORDS = tuple(
+    (intent, frozenset(trigger + suffix for trigger in triggers if " " not in trigger
+                       for suffix in _TRIGGER_SUFFIXES))
+    for intent, triggers in INTENT_TRIGGERS
+)
+
+# Multi-word phrases share one compiled scan: a named group per intent inside
+# a lookahead, so overlapping phrases are all reported
+_INTENT_RE = re.compile("(?=" + "|".join(
+    f"(?P<{intent}>" + "|".join(re.escape(trigger) for trigger in triggers if " " in trigger) + ")"
+    for intent, triggers in INTENT_TRIGGERS
+    if any(" " in trigger for trigger in triggers)
+) + ")")
+
+
+
+def _build_framework_matcher(names: Iterable[str]):
+    """
+    Compile framework names into a function returning the first name found
+    in a lowercased question (or None).
+
+    Uses an Aho-Corasick automaton when pyahocorasick is installed, otherwise
+    a single compiled regex alternation.
+    """
+    canonical = {name.lower(): name for name in names if name}
+    if not canonical:
+        return lambda question_lower: None
+
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for lowered, name in canonical.items():
+            automaton.add_word(lowered, (len(lowered), name))
+        automaton.make_automaton()
+
+        def find(question_lower):
+            # Leftmost match, longest name on ties - same as the regex fallback
+            best = None
+            for end, (length, name) in automaton.iter(question_lower):
+                key = (end - length, -length)
+                if best is None or key < best[0]:
+                    best = (key, name)
+            return best[1] if best else None
+        return find
+
+    # Longest names first so "blue ocean strategy" wins over "blue ocean"
+    pattern = re.compile("|".join(map(re.escape, sorted(canonical, key=len, reverse=True))))
+
+    def find(question_lower):
+        match = pattern.search(question_lower)
+        return canonical[match.group()] if match else None
+    return find
+
+
+_find_framework_name = _build_framework_matcher(KNOWN_FRAMEWORKS)
+
+
+def register_framework_names(names: Iterable[str]):
+    """Rebuild the router's framework-name matcher from KNOWN_FRAMEWORKS plus `names`."""
+    global _find_framework_name
+    _find_framework_name = _build_framework_matcher([*KNOWN_FRAMEWORKS, *names])
+    _route_question.cache_clear()
+
+
+def load_known_frameworks(driver, database: Optional[str] = None) -> Tuple[str, ...]:
+    """
+    Load the Framework catalog from Neo4j and register it with the router.
+
+    Returns:
+        Framework names found in the graph
+    """
+    names = tuple(record["name"] for record in run_query(driver, "list_framework_names", database=database))
+    register_framework_names(names)
+    return names
+
+
+
+
 def select_query_for_question(question_text, persona=None, problem_type=None):
     """
     Intelligently select the best Cypher query based on question characteristics
 
+    Routing is memoized per (lowercased question, persona, problem_type), so
+    repeated questions skip the intent scan.
+
     Args:
         question_text: User's question
         persona: Detected persona (optional)
@@ -427,85 +667,374 @@ def select_query_for_question(question_text, persona=None, problem_type=None):
     Returns:
         tuple: (query_name, query_text, suggested_parameters)
     """
-    question_lower = question_text.lower()
+    query_name, params = _route_question(question_text.lower(), persona, problem_type)
+    if query_name == "semantic_framework_search":
+        # The search text keeps the question's original casing
+        suggested_params = {"search_query": question_text}
+    else:
+        suggested_params = dict(params)
+    return query_name, CYPHER_QUERIES[query_name], suggested_params
+
+
+ROUTE_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=ROUTE_CACHE_SIZE)
+def _route_question(question_lower: str, persona, problem_type) -> Tuple[str, Tuple[Tuple[str, Any], ...]]:
+    """Pick (query_name, parameter items) for a lowercased question (cached)."""
+    tokens = frozenset(_TOKEN_RE.findall(question_lower))
+    intents = {intent for intent, words in _INTENT_WORDS if not tokens.isdisjoint(words)}
+    intents.update(match.lastgroup for match in _INTENT_RE.finditer(question_lower))
 
     # Framework discovery questions
-    if any(word in question_lower for word in ["which framework", "what framework", "recommend framework"]):
+    if "framework_discovery" in intents:
         if problem_type:
-            return (
-                "find_frameworks_by_problem_type",
-                CYPHER_QUERIES["find_frameworks_by_problem_type"],
-                {"problem_type": problem_type}
-            )
+            return "find_frameworks_by_problem_type", (("problem_type", problem_type),)
         elif persona:
-            return (
-                "find_frameworks_by_persona",
-                CYPHER_QUERIES["find_frameworks_by_persona"],
-                {"persona": persona}
-            )
+            return "find_frameworks_by_persona", (("persona", persona),)
         else:
-            return (
-                "find_beginner_frameworks",
-                CYPHER_QUERIES["find_beginner_frameworks"],
-                {}
-            )
+            return "find_beginner_frameworks", ()
 
     # Problem type classification
-    if any(word in question_lower for word in ["what type of problem", "classify", "problem type"]):
-        return (
-            "get_problem_type_details",
-            CYPHER_QUERIES["get_problem_type_details"],
-            {"problem_type": problem_type or "Ill-Defined"}
-        )
+    if "classification" in intents:
+        return "get_problem_type_details", (("problem_type", problem_type or "Ill-Defined"),)
 
     # Related frameworks
-    if any(word in question_lower for word in ["related to", "similar to", "complements"]):
+    if "related" in intents:
         # Extract framework name from question (simplified)
-        for fw in ["Design Thinking", "Jobs-to-be-Done", "Blue Ocean", "Lean Startup"]:
-            if fw.lower() in question_lower:
-                return (
-                    "find_related_frameworks",
-                    CYPHER_QUERIES["find_related_frameworks"],
-                    {"framework_name": fw}
-                )
+        framework_name = _find_framework_name(question_lower)
+        if framework_name:
+            return "find_related_frameworks", (("framework_name", framework_name),)
 
     # Learning path
-    if any(word in question_lower for word in ["learning path", "where to start", "progression"]):
-        return (
-            "learning_path_for_persona",
-            CYPHER_QUERIES["learning_path_for_persona"],
-            {"persona": persona or "Entrepreneur"}
-        )
+    if "learning_path" in intents:
+        return "learning_path_for_persona", (("persona", persona or "Entrepreneur"),)
 
     # Portfolio questions
-    if any(word in question_lower for word in ["portfolio", "now new next", "three box"]):
-        return (
-            "portfolio_recommendations",
-            CYPHER_QUERIES["portfolio_recommendations"],
-            {}
-        )
+    if "portfolio" in intents:
+        return "portfolio_recommendations", ()
 
     # Case studies
-    if any(word in question_lower for word in ["example", "case study", "real world"]):
-        return (
-            "find_case_studies",
-            CYPHER_QUERIES["find_case_studies"],
-            {"framework_name": "Design Thinking"}  # Default
-        )
-
-    # Default: semantic search
-    return (
-        "semantic_framework_search",
-        CYPHER_QUERIES["semantic_framework_search"],
-        {"search_query": question_text}
+    if "case_study" in intents:
+        return "find_case_studies", (("framework_name", "Design Thinking"),)  # Default
+
+    # Default: semantic search (parameters are filled in from the original question)
+    return "semantic_framework_search", ()
+
+
+# ============================================================================
+# QUERY EXECUTION
+# ============================================================================
+
+STREAM_FETCH_SIZE = 1000
+
+# Queries whose parameters are open user text - nearly every call is unique,
+# so caching their results would only evict useful entries
+UNCACHED_QUERIES = frozenset({
+    "search_concepts_by_keyword",
+    "find_document_chunks",
+    "semantic_framework_search",
+    "vector_concept_search",
+    "vector_framework_search",
+})
+
+# Bumped by invalidate_query_cache() after writes; part of every cache key
+_ingest_generation = 0
+
+
+class TTLCache:
+    """Bounded LRU map whose entries expire after `ttl` seconds (thread-safe)"""
+
+    def __init__(self, max_entries=NEO4J_RESULT_CACHE_MAX_ENTRIES, ttl=NEO4J_RESULT_CACHE_TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()  # key -> (value, expiry)
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return the live value for key, or None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[1] < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+# driver -> TTLCache of its query results. The one result cache, shared by
+# run_query() and LarryNeo4jRAG.execute_query(); entries expire after
+# NEO4J_RESULT_CACHE_TTL_SECONDS, so writes from another process (e.g.
+# neo4j_schema_init.py) show up without invalidate_query_cache(). Weakly
+# keyed, so a closed and discarded driver is not kept alive by its results
+_result_caches = weakref.WeakKeyDictionary()
+_result_caches_lock = threading.Lock()
+
+
+def result_cache(driver) -> TTLCache:
+    """Return the result cache for queries run on `driver`."""
+    with _result_caches_lock:
+        cache = _result_caches.get(driver)
+        if cache is None:
+            cache = _result_caches[driver] = TTLCache()
+        return cache
+
+
+def result_cache_key(database, query: str, params: Optional[Dict[str, Any]], max_records=None) -> Optional[tuple]:
+    """
+    Key a query's results in result_cache().
+
+    Returns None when a parameter value is not hashable (e.g. an embedding
+    list is fine as a tuple, but a dict is not); such results are not cached.
+    """
+    key = (_ingest_generation, database, query, max_records, tuple(sorted(
+        (name, tuple(value) if isinstance(value, list) else value)
+        for name, value in (params or {}).items()
+    )))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def freeze_record(record) -> MappingProxyType:
+    """Read-only copy of a record (list values become tuples), safe to share from a cache."""
+    return MappingProxyType({
+        key: tuple(value) if isinstance(value, list) else value
+        for key, value in record.items()
+    })
+
+
+def stream_query(
+    driver,
+    name: str,
+    params: Optional[Dict[str, Any]] = None,
+    database: Optional[str] = None,
+    fetch_size: int = STREAM_FETCH_SIZE
+) -> Iterator[Dict[str, Any]]:
+    """
+    Run a library query and yield its records one at a time.
+
+    Records are pulled from the server in batches of `fetch_size` as the
+    caller iterates, instead of buffering the whole result (as
+    result.data() or list(result) do). Prefer this for queries with large
+    or wide results such as find_document_chunks and
+    enrich_response_with_context. The queries project scalar properties
+    (f.name etc.) rather than whole nodes, which keeps each record small
+    and lets records be copied with dict(record) instead of record.data()
+    (no recursive node/relationship conversion).
+
+    Args:
+        driver: neo4j.Driver
+        name: Key in CYPHER_QUERIES
+        params: Query parameters
+        database: Target database (driver default if None)
+        fetch_size: Records requested from the server per batch
+
+    Yields:
+        Each record as a dict
+    """
+    with driver.session(database=database, fetch_size=fetch_size) as session:
+        for record in session.run(CYPHER_QUERIES[name], params or {}):
+            yield dict(record)
+
+
+def run_query(
+    driver,
+    name: str,
+    params: Optional[Dict[str, Any]] = None,
+    database: Optional[str] = None
+) -> tuple:
+    """
+    Run a library query, caching results per parameter set in result_cache().
+
+    Most queries range over the small fixed domains in PARAMETER_TEMPLATES,
+    so repeat calls are answered from memory without a server round-trip.
+    Queries in UNCACHED_QUERIES always go to the server. Cached results
+    expire after NEO4J_RESULT_CACHE_TTL_SECONDS; call
+    invalidate_query_cache() after writing to the graph from this process.
+
+    Args:
+        driver: neo4j.Driver
+        name: Key in CYPHER_QUERIES
+        params: Query parameters (lists are treated as tuples)
+        database: Target database (driver default if None)
+
+    Returns:
+        Tuple of read-only record mappings (shared between callers)
+
+    Raises:
+        TypeError: If a parameter value is not hashable
+    """
+    if name in UNCACHED_QUERIES:
+        return tuple(stream_query(driver, name, params, database))
+
+    query = CYPHER_QUERIES[name]
+    key = result_cache_key(database, query, params)
+    if key is None:
+        raise TypeError(f"Parameters for cached query '{name}' must be hashable: {params!r}")
+    cache = result_cache(driver)
+    records = cache.get(key)
+    if records is None:
+        records, _, _ = driver.execute_query(query, params or {}, database_=database)
+        records = tuple(map(freeze_record, records))
+        cache.put(key, records)
+    return records
+
+
+def invalidate_query_cache():
+    """Drop all cached query results (call after ingesting or editing graph data)."""
+    global _ingest_generation
+    _ingest_generation += 1
+    with _result_caches_lock:
+        _result_caches.clear()
+
+
+# ============================================================================
+# GENERATED QUERIES - LLM-written Cypher (Text2Cypher)
+# ============================================================================
+
+# Generated queries usually differ only in the text they search for
+# (`WHERE f.name CONTAINS 'design'`). Lifting those literals into parameters
+# lets structurally identical queries share one cached plan on the server.
+_CONTAINS_LITERAL_RE = re.compile(r"""\bCONTAINS\s+(['"])([^'"\\]*)\1""", re.IGNORECASE)
+
+# Row cap added to generated read queries that have none, so a broad MATCH
+# can't pull a whole label over Bolt just to be trimmed client-side
+GENERATED_QUERY_LIMIT = 25
+_RETURN_RE = re.compile(r"\bRETURN\b", re.IGNORECASE)
+_LIMIT_OR_UNION_RE = re.compile(r"\b(?:LIMIT|UNION)\b", re.IGNORECASE)
+
+
+def parameterize_literals(query: str) -> Tuple[str, Dict[str, str]]:
+    """
+    Replace the string literals of CONTAINS predicates with parameters.
+
+    Literals containing quotes or escapes are left in place.
+
+    Args:
+        query: Cypher text, e.g. from GraphCypherQAChain
+
+    Returns:
+        (rewritten query, parameters) - parameters is empty if nothing changed
+    """
+    params: Dict[str, str] = {}
+
+    def _lift(match) -> str:
+        key = f"contains_{len(params)}"
+        params[key] = match.group(2)
+        return f"CONTAINS ${key}"
+
+    return _CONTAINS_LITERAL_RE.sub(_lift, query), params
+
+
+def ensure_limit(query: str, limit: int = GENERATED_QUERY_LIMIT) -> str:
+    """
+    Append `LIMIT limit` to a query that returns rows without one.
+
+    Queries without RETURN, or with UNION (where a trailing LIMIT would
+    only bind the last branch), are returned unchanged.
+    """
+    if not _RETURN_RE.search(query) or _LIMIT_OR_UNION_RE.search(query):
+        return query
+    # On its own line so a trailing // comment can't swallow it
+    return f"{query.rstrip().rstrip(';').rstrip()}\nLIMIT {limit}"
+
+
+# ============================================================================
+# BENCHMARK
+# ============================================================================
+
+def _total_db_hits(plan) -> int:
+    """Sum dbHits over a PROFILE plan tree (as returned in the result summary)."""
+    if not plan:
+        return 0
+    return plan.get("dbHits", 0) + sum(_total_db_hits(child) for child in plan.get("children", ()))
+
+
+def _profiled(query: str) -> str:
+    """Insert PROFILE after the CYPHER options line (if any) of a library query."""
+    if query.startswith("CYPHER"):
+        options, body = query.split("\n", 1)
+        return f"{options} PROFILE\n{body}"
+    return "PROFILE" + query
+
+
+def benchmark(driver, n: int = 100, warmup: int = 5, database: Optional[str] = None):
+    """
+    Time every query in PARAMETER_TEMPLATES over all its parameter combinations.
+
+    Each combination runs `warmup` untimed times first (driver connections and
+    the server plan cache are then warm, so only execution is measured), then
+    `n` timed runs, and one PROFILE run for its db hits. Results bypass the
+    run_query cache and are fully fetched, so no work is skipped.
+
+    Yields:
+        {"query", "params", "p50_us", "p95_us", "db_hits"} per combination
+    """
+    for name, templates in PARAMETER_TEMPLATES.items():
+        query = CYPHER_QUERIES[name]
+        for values in product(*templates.values()):
+            params = dict(zip(templates, values))
+            for _ in range(warmup):
+                driver.execute_query(query, params, database_=database)
+
+            samples = []
+            for _ in range(n):
+                start = time.perf_counter_ns()
+                driver.execute_query(query, params, database_=database)
+                samples.append(time.perf_counter_ns() - start)
+            samples.sort()
+
+            _, summary, _ = driver.execute_query(_profiled(query), params, database_=database)
+            yield {
+                "query": name,
+                "params": params,
+                "p50_us": samples[len(samples) // 2] // 1000,
+                "p95_us": samples[min(len(samples) - 1, len(samples) * 95 // 100)] // 1000,
+                "db_hits": _total_db_hits(summary.profile),
+            }
+
+
+def _run_benchmark():
+    """`python larry_cypher_queries.py --bench [N]` - print one JSON line per combination."""
+    from neo4j import GraphDatabase
+
+    args = sys.argv[sys.argv.index("--bench") + 1:]
+    n = int(args[0]) if args else 100
+    driver = GraphDatabase.driver(
+        os.getenv("NEO4J_URI"),
+        auth=(os.getenv("NEO4J_USER"), os.getenv("NEO4J_PASSWORD"))
     )
+    try:
+        for row in benchmark(driver, n=n, database=os.getenv("NEO4J_DATABASE", "neo4j")):
+            print(json.dumps(row), flush=True)
+    finally:
+        driver.close()
 
 
 # ============================================================================
 # USAGE EXAMPLES
 # ============================================================================
 
-if __name__ == "__main__":
+if __name__ == "__main__" and "--bench" in sys.argv:
+    _run_benchmark()
+
+elif __name__ == "__main__":
     # Example usage
     print("Larry Cypher Query Library")
     print("=" * 60)
@@ -513,14 +1042,14 @@ if __name__ == "__main__":
     print("\nQuery categories:")
 
     categories = {
-        "Framework Discovery": 4,
+        "Framework Discovery": 5,
         "Problem Type Classification": 2,
-        "Concept & Knowledge Discovery": 2,
+        "Concept & Knowledge Discovery": 3,
         "Author & Book Queries": 2,
         "Portfolio & Innovation Horizon": 2,
         "Learning Paths & Recommendations": 2,
         "Case Studies & Examples": 1,
-        "Advanced Queries": 3,
+        "Advanced Queries": 4,
         "Diagnostic Queries": 1,
         "Content Enrichment": 1
     }
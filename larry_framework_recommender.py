@@ -4,7 +4,40 @@ Larry Framework Recommender
 Smart framework suggestions based on conversation context, problem type, and persona
 """
 
-from typing import List, Dict, Tuple
+import heapq
+import re
+import sys
+from functools import lru_cache
+from typing import Callable, List, Dict, NamedTuple, Set, Tuple, Union
+
+# Aho-Corasick is optional: scans a message for all keywords in one pass
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+class Recommendation(NamedTuple):
+    """One recommended framework (use _asdict() for JSON serialization)"""
+    name: str
+    score: int
+    mentions: int
+    description: str
+    uncertainty_level: str
+    risk_level: str
+
+class MessageContext(NamedTuple):
+    """A user message normalized once, shared by every analysis of the turn"""
+    raw: str
+    lower: str
+
+def prepare_context(user_message: str) -> MessageContext:
+    """Lowercase/strip a message once for calculate_uncertainty_risk and recommend_frameworks"""
+    return MessageContext(user_message, user_message.lower().strip())
+
+def _message_lower(user_message: Union[str, MessageContext]) -> str:
+    if isinstance(user_message, MessageContext):
+        return user_message.lower
+    return user_message.lower().strip()
 
 # Framework Database (from 2,988 chunk knowledge base)
 FRAMEWORKS = {
@@ -118,13 +151,115 @@ FRAMEWORKS = {
     }
 }
 
-def calculate_uncertainty_risk(problem_type: str, user_message: str) -> Tuple[str, str, int, int]:
+# Column layout of FRAMEWORKS for recommend_frameworks: parallel tuples indexed
+# by framework position, with problem types and personas as int bitmasks
+_NAMES = tuple(sys.intern(name) for name in FRAMEWORKS)
+_MENTIONS = tuple(data['mentions'] for data in FRAMEWORKS.values())
+# (description, uncertainty_level, risk_level) for building Recommendations
+_DETAILS = tuple(
+    (data['description'], data['uncertainty_level'], data['risk_level'])
+    for data in FRAMEWORKS.values()
+)
+_PROBLEM_BITS = {
+    problem_type: 1 << bit
+    for bit, problem_type in enumerate(sorted({pt for data in FRAMEWORKS.values() for pt in data['problem_types']}))
+}
+_PERSONA_BITS = {
+    persona: 1 << bit
+    for bit, persona in enumerate(sorted({p for data in FRAMEWORKS.values() for p in data['personas']}))
+}
+_PROBLEM_MASKS = tuple(sum(_PROBLEM_BITS[pt] for pt in data['problem_types']) for data in FRAMEWORKS.values())
+_PERSONA_MASKS = tuple(sum(_PERSONA_BITS[p] for p in data['personas']) for data in FRAMEWORKS.values())
+
+# keyword -> indices (into _NAMES) of the frameworks listing it
+_KEYWORD_FRAMEWORKS: Dict[str, List[int]] = {}
+for _index, _data in enumerate(FRAMEWORKS.values()):
+    for _keyword in _data['keywords']:
+        _KEYWORD_FRAMEWORKS.setdefault(_keyword, []).append(_index)
+
+
+def _build_keyword_scanner(keywords) -> Callable[[str], Set[str]]:
+    """
+    Compile keywords into one scanner returning the set of keywords that occur
+    (as substrings) in a lowercased message.
+
+    Uses an Aho-Corasick automaton when pyahocorasick is installed. Otherwise
+    a single regex tries the longest keyword at every position; keywords
+    contained in a matched one (e.g. 'market' in 'new market') are credited too.
+    """
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for keyword in keywords:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        return lambda message_lower: {keyword for _, keyword in automaton.iter(message_lower)}
+
+    contained = {keyword: frozenset(k for k in keywords if k in keyword) for keyword in keywords}
+    pattern = re.compile("(?=(" + "|".join(map(re.escape, sorted(keywords, key=len, reverse=True))) + "))")
+
+    def scan(message_lower):
+        found = set()
+        for match in pattern.finditer(message_lower):
+            found |= contained[match.group(1)]
+        return found
+    return scan
+
+
+_matched_keywords = _build_keyword_scanner(list(_KEYWORD_FRAMEWORKS))
+
+
+# Message signals that nudge the uncertainty / risk scores:
+# (signal, words, uncertainty delta, risk delta)
+_SIGNALS = (
+    ('uncertainty_up', ['future', 'trend', 'unknown', 'uncertain', 'predict'], 15, 0),
+    ('risk_up', ['invest', 'bet', 'risk', 'failure', 'expensive'], 0, 15),
+    ('uncertainty_down', ['proven', 'known', 'established', 'clear', 'defined'], -15, 0),
+    ('risk_down', ['safe', 'tested', 'validated', 'low cost', 'prototype'], 0, -15),
+)
+_SIGNAL_BITS = {signal: 1 << bit for bit, (signal, _, _, _) in enumerate(_SIGNALS)}
+
+# One pattern per signal. Words are stems matched at a word start, optionally
+# after a negating "un", so 'investment' and 'unpredictable' still count and
+# 'unknown' sets both uncertainty signals, as the old substring scan did
+_SIGNAL_PATTERNS = tuple(
+    (_SIGNAL_BITS[signal], re.compile(r"\b(?:un)?(?:" + "|".join(map(re.escape, words)) + ")"))
+    for signal, words, _, _ in _SIGNALS
+)
+
+# signal bitmask -> (uncertainty delta, risk delta)
+_SIGNAL_DELTAS = tuple(
+    (
+        sum(uncertainty for bit, (_, _, uncertainty, _) in enumerate(_SIGNALS) if mask >> bit & 1),
+        sum(risk for bit, (_, _, _, risk) in enumerate(_SIGNALS) if mask >> bit & 1),
+    )
+    for mask in range(1 << len(_SIGNALS))
+)
+
+
+def _signal_mask(message_lower: str) -> int:
+    """Bitmask (see _SIGNAL_BITS) of the score signals present in a lowercased message"""
+    mask = 0
+    for bit, pattern in _SIGNAL_PATTERNS:
+        if pattern.search(message_lower):
+            mask |= bit
+    return mask
+
+def calculate_uncertainty_risk(
+    problem_type: str,
+    user_message: Union[str, MessageContext]
+) -> Tuple[str, str, int, int]:
     """
     Calculate uncertainty and risk levels based on problem type and context
 
+    user_message may be a MessageContext from prepare_context()
     Returns: (uncertainty_level, risk_level, uncertainty_score, risk_score)
     uncertainty_score and risk_score are 0-100
     """
+    return _calculate_uncertainty_risk(problem_type, _message_lower(user_message))
+
+@lru_cache(maxsize=2048)
+def _calculate_uncertainty_risk(problem_type: str, message_lower: str) -> Tuple[str, str, int, int]:
+    """calculate_uncertainty_risk for a normalized message (cached; retries/re-renders are O(1))"""
 
     # Base levels from problem type
     base_mapping = {
@@ -137,24 +272,11 @@ def calculate_uncertainty_risk(problem_type: str, user_message: str) -> Tuple[st
     base = base_mapping.get(problem_type, base_mapping['general'])
     uncertainty_level, risk_level, uncertainty_score, risk_score = base
 
-    # Adjust based on keywords in message
-    message_lower = user_message.lower()
-
-    # High uncertainty indicators
-    if any(word in message_lower for word in ['future', 'trend', 'unknown', 'uncertain', 'predict']):
-        uncertainty_score = min(100, uncertainty_score + 15)
-
-    # High risk indicators
-    if any(word in message_lower for word in ['invest', 'bet', 'risk', 'failure', 'expensive']):
-        risk_score = min(100, risk_score + 15)
-
-    # Low uncertainty indicators
-    if any(word in message_lower for word in ['proven', 'known', 'established', 'clear', 'defined']):
-        uncertainty_score = max(0, uncertainty_score - 15)
-
-    # Low risk indicators
-    if any(word in message_lower for word in ['safe', 'tested', 'validated', 'low cost', 'prototype']):
-        risk_score = max(0, risk_score - 15)
+    # Adjust based on keywords in message (high/low uncertainty and risk
+    # indicators, all found in one scan)
+    uncertainty_delta, risk_delta = _SIGNAL_DELTAS[_signal_mask(message_lower)]
+    uncertainty_score = min(100, max(0, uncertainty_score + uncertainty_delta))
+    risk_score = min(100, max(0, risk_score + risk_delta))
 
     # Update level labels based on final scores
     if uncertainty_score > 75:
@@ -178,73 +300,77 @@ def calculate_uncertainty_risk(problem_type: str, user_message: str) -> Tuple[st
 def recommend_frameworks(
     problem_type: str,
     persona: str,
-    user_message: str,
+    user_message: Union[str, MessageContext],
     max_recommendations: int = 3
-) -> List[Dict]:
+) -> List[Recommendation]:
     """
     Recommend frameworks based on context
 
+    user_message may be a MessageContext from prepare_context()
     Returns list of recommended frameworks with scores
     """
+    # Recommendations are immutable, so the cached tuple can be shared as-is
+    return list(_recommend_frameworks(problem_type, persona, _message_lower(user_message), max_recommendations))
 
-    message_lower = user_message.lower()
-    recommendations = []
-
-    for framework_name, framework_data in FRAMEWORKS.items():
-        score = 0
+@lru_cache(maxsize=2048)
+def _recommend_frameworks(
+    problem_type: str,
+    persona: str,
+    message_lower: str,
+    max_recommendations: int
+) -> Tuple[Recommendation, ...]:
+    """recommend_frameworks for a normalized message (cached; retries/re-renders are O(1))"""
+    # One scan of the message tallies keyword hits for every framework
+    keyword_hits = [0] * len(_NAMES)
+    for keyword in _matched_keywords(message_lower):
+        for index in _KEYWORD_FRAMEWORKS[keyword]:
+            keyword_hits[index] += 1
 
-        # Problem type match (40 points)
-        if problem_type in framework_data['problem_types']:
-            score += 40
+    problem_bit = _PROBLEM_BITS.get(problem_type, 0)
+    persona_bit = _PERSONA_BITS.get(persona, 0)
 
-        # Persona match (30 points)
-        if persona in framework_data['personas']:
-            score += 30
+    # Score every framework as a bare int first
+    candidates = []
+    for index, (problem_mask, persona_mask, hits) in enumerate(zip(_PROBLEM_MASKS, _PERSONA_MASKS, keyword_hits)):
+        score = (
+            (40 if problem_mask & problem_bit else 0)  # Problem type match (40 points)
+            + (30 if persona_mask & persona_bit else 0)  # Persona match (30 points)
+            + min(30, hits * 5)  # Keyword match (30 points max, 5 per keyword)
+        )
+        if score > 0:
+            candidates.append((-score, -_MENTIONS[index], index))
 
-        # Keyword match (30 points max, 5 per keyword)
-        keyword_matches = sum(1 for keyword in framework_data['keywords'] if keyword in message_lower)
-        score += min(30, keyword_matches * 5)
+    # Top N by score, then mentions (partial selection, no full sort); only
+    # the winners are expanded into Recommendation tuples
+    recommendations = []
+    for neg_score, neg_mentions, index in heapq.nsmallest(max_recommendations, candidates):
+        recommendations.append(Recommendation(_NAMES[index], -neg_score, -neg_mentions, *_DETAILS[index]))
+    return tuple(recommendations)
 
-        if score > 0:
-            recommendations.append({
-                'name': framework_name,
-                'score': score,
-                'mentions': framework_data['mentions'],
-                'description': framework_data['description'],
-                'uncertainty_level': framework_data['uncertainty_level'],
-                'risk_level': framework_data['risk_level']
-            })
-
-    # Sort by score and return top N
-    recommendations.sort(key=lambda x: (-x['score'], -x['mentions']))
-    return recommendations[:max_recommendations]
-
-def get_framework_notification(recommended_frameworks: List[Dict]) -> str:
+def get_framework_notification(recommended_frameworks: List[Recommendation]) -> str:
     """
     Generate gentle notification about relevant frameworks
     """
 
-    if not recommended_frameworks:
+    count = len(recommended_frameworks)
+    if not count:
         return ""
 
-    if len(recommended_frameworks) == 1:
-        framework = recommended_frameworks[0]
-        return f"💡 **Relevant Framework**: {framework['name']} might help here"
-    elif len(recommended_frameworks) == 2:
-        names = " and ".join([f['name'] for f in recommended_frameworks])
-        return f"💡 **Relevant Frameworks**: {names} could be useful"
-    else:
-        names = ", ".join([f['name'] for f in recommended_frameworks[:2]])
-        return f"💡 **Relevant Frameworks**: {names}, and others could apply here"
+    first = recommended_frameworks[0].name
+    if count == 1:
+        return f"💡 **Relevant Framework**: {first} might help here"
+
+    second = recommended_frameworks[1].name
+    if count == 2:
+        return f"💡 **Relevant Frameworks**: {first} and {second} could be useful"
+    return f"💡 **Relevant Frameworks**: {first}, {second}, and others could apply here"
 
 def get_all_frameworks_sorted() -> List[Dict]:
     """Get all frameworks sorted by mentions for display"""
-    frameworks = []
-    for name, data in FRAMEWORKS.items():
-        frameworks.append({
-            'name': name,
-            'mentions': data['mentions'],
-            'description': data['description']
-        })
-    frameworks.sort(key=lambda x: -x['mentions'])
-    return frameworks
+    return [dict(framework) for framework in _ALL_FRAMEWORKS_SORTED]
+
+# FRAMEWORKS is static, so the display order is computed once
+_ALL_FRAMEWORKS_SORTED = tuple(
+    {'name': name, 'mentions': data['mentions'], 'description': data['description']}
+    for name, data in sorted(FRAMEWORKS.items(), key=lambda item: -item[1]['mentions'])
+)
@@ -0,0 +1,183 @@
+"""
+Larry Navigator - Shared Gemini client
+One genai.Client per API key for the whole process (LarryChat, LarryNavigator),
+plus the Gemini context cache that holds the static system prompt
+"""
+
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import TYPE_CHECKING, List, Optional
+
+from larry_config import (
+    EMBEDDING_BATCH_SIZE,
+    EMBEDDING_CACHE_MAX_ENTRIES,
+    GEMINI_HTTP_TIMEOUT_MS,
+    PROMPT_CACHE_MIN_CHARS,
+    PROMPT_CACHE_TTL_SECONDS,
+)
+
+# HTTP/2 support for httpx is optional (requires the `h2` package)
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# The google-genai SDK is imported on first use, not at module import
+if TYPE_CHECKING:
+    from google import genai
+
+
+@lru_cache(maxsize=None)
+def _build_client(api_key: str) -> "genai.Client":
+    """Construct the client for an API key (called once per key)."""
+    from google import genai
+    from google.genai import types
+
+    http_options = types.HttpOptions(timeout=GEMINI_HTTP_TIMEOUT_MS)
+    if HTTP2_AVAILABLE:
+        http_options.client_args = {"http2": True}
+        http_options.async_client_args = {"http2": True}
+    return genai.Client(api_key=api_key, http_options=http_options)
+
+
+def get_client(api_key: Optional[str] = None) -> Optional["genai.Client"]:
+    """
+    Return the process-wide Gemini client.
+
+    Every caller shares one client - and so one HTTP connection pool, auth
+    state and set of worker threads - instead of each entry point building
+    its own. When `h2` is installed the transport negotiates HTTP/2 so
+    concurrent streams share one socket.
+
+    Args:
+        api_key: Gemini API key (defaults to GOOGLE_AI_API_KEY)
+
+    Returns:
+        The shared client, or None if no API key is available
+    """
+    api_key = api_key or os.getenv("GOOGLE_AI_API_KEY")
+    if not api_key:
+        return None
+    return _build_client(api_key)
+
+
+# (client, model, cache_key, prompt digest) -> (cache name or None, monotonic refresh deadline)
+_prompt_caches = {}
+# One lock per key, so concurrent sessions create each context cache once
+_prompt_cache_locks = {}
+_prompt_cache_locks_lock = threading.Lock()
+
+
+@lru_cache(maxsize=16)
+def _prompt_digest(system_instruction: str) -> str:
+    """Digest of a system prompt (computed once per prompt string)."""
+    return hashlib.blake2b(system_instruction.encode(), digest_size=16).hexdigest()
+
+
+def get_prompt_cache(client, model: str, system_instruction: str, tools=None, cache_key=None) -> Optional[str]:
+    """
+    Return the name of a Gemini context cache holding a system prompt + tools.
+
+    The multi-KB system prompt is uploaded once per TTL instead of being sent
+    (and billed) as system_instruction on every request. The cache is
+    re-created shortly before it expires. Returns None when the prompt is
+    below the caching threshold or caching is unavailable; callers then send
+    the prompt inline.
+
+    Args:
+        client: Shared client from get_client()
+        model: Model the cache is created for (caches are per model)
+        system_instruction: Static system prompt to cache
+        tools: Optional tools stored alongside the prompt
+        cache_key: Distinguishes caches with different tools (e.g. the File Search store name)
+    """
+    if len(system_instruction) < PROMPT_CACHE_MIN_CHARS:
+        return None
+
+    key = (client, model, cache_key, _prompt_digest(system_instruction))
+    entry = _prompt_caches.get(key)
+    if entry and entry[1] > time.monotonic():
+        return entry[0]
+
+    with _prompt_cache_locks_lock:
+        lock = _prompt_cache_locks.setdefault(key, threading.Lock())
+    with lock:
+        # Another thread may have created the cache while this one waited
+        now = time.monotonic()
+        entry = _prompt_caches.get(key)
+        if entry and entry[1] > now:
+            return entry[0]
+
+        from google.genai import types
+
+        try:
+            cache = client.caches.create(
+                model=model,
+                config=types.CreateCachedContentConfig(
+                    system_instruction=system_instruction,
+                    tools=tools,
+                    ttl=f"{PROMPT_CACHE_TTL_SECONDS}s"
+                )
+            )
+        except Exception as e:
+            # Don't retry on every turn; fall back to the inline prompt until the next window
+            print(f"Prompt caching unavailable, sending system prompt inline: {e}")
+            _prompt_caches[key] = (None, now + PROMPT_CACHE_TTL_SECONDS)
+            return None
+
+        # Refresh a minute before the server-side TTL lapses
+        _prompt_caches[key] = (cache.name, now + PROMPT_CACHE_TTL_SECONDS - 60)
+        return cache.name
+
+
+# (model, text) -> embedding values, most recently used last
+_embeddings = OrderedDict()
+_embeddings_lock = threading.Lock()
+
+
+def embed_texts(client, model: str, texts: List[str]) -> List[List[float]]:
+    """
+    Embed texts, reusing any embedding this process has already fetched.
+
+    The semantic response cache and the Neo4j vector search embed the same
+    questions with the same model, so each text costs one embed_content call
+    per process rather than one per caller. Texts not seen before are sent
+    together, EMBEDDING_BATCH_SIZE per request. Raises whatever
+    embed_content raises.
+
+    Args:
+        client: Shared client from get_client()
+        model: Gemini embedding model name
+        texts: Texts to embed
+
+    Returns:
+        One list of floats per text, in order
+    """
+    with _embeddings_lock:
+        found = {}
+        for text in texts:
+            values = _embeddings.get((model, text))
+            if values is not None:
+                _embeddings.move_to_end((model, text))
+                found[text] = values
+    missing = list(dict.fromkeys(text for text in texts if text not in found))
+
+    if missing:
+        fetched = []
+        for start in range(0, len(missing), EMBEDDING_BATCH_SIZE):
+            result = client.models.embed_content(model=model, contents=missing[start:start + EMBEDDING_BATCH_SIZE])
+            fetched.extend(embedding.values for embedding in result.embeddings)
+        with _embeddings_lock:
+            for text, values in zip(missing, fetched):
+                _embeddings[(model, text)] = values
+                _embeddings.move_to_end((model, text))
+                found[text] = values
+            while len(_embeddings) > EMBEDDING_CACHE_MAX_ENTRIES:
+                _embeddings.popitem(last=False)
+
+    return [found[text] for text in texts]
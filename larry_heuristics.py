@@ -0,0 +1,64 @@
+"""
+Larry Navigator - Persona / problem-type heuristics
+Keyword tables shared by LarryStateEngine and the ContextUpdateTool
+"""
+
+import re
+from functools import lru_cache
+from typing import Tuple
+
+# google-re2 is optional: a linear-time DFA engine with the same API as re
+try:
+    import re2 as _keyword_re
+except ImportError:
+    _keyword_re = re
+
+# Persona / problem-type heuristics, checked in order
+PERSONA_KEYWORDS = (
+    ("entrepreneur", ("startup", "founder", "venture", "market fit")),
+    ("corporate", ("corporate", "company", "companies", "stakeholder", "portfolio")),
+    ("researcher", ("research", "theory", "theories", "hypothes", "literature")),
+    ("consultant", ("client", "workshop", "facilitat", "consult")),
+    ("student", ("exam", "study", "studies", "assignment")),
+)
+
+# (problem type, initial uncertainty score, keywords)
+PROBLEM_TYPE_KEYWORDS = (
+    ("undefined", 0, ("future", "trend", "macro", "scenario", "long-term", "disrupt")),
+    ("ill-defined", 50, ("opportunit", "near-term", "expansion", "growth", "next step")),
+    ("well-defined", 85, ("implement", "build", "execut", "prototyp", "solution", "finaliz")),
+)
+
+
+def keyword_regex(keywords):
+    """
+    One alternation per bucket. Keywords are stems anchored at a word start
+    only, so "consult" still matches "consultant" and "implement" matches
+    "implementation", but a stem never matches from inside another word.
+    """
+    return _keyword_re.compile(r"\b(?:" + "|".join(map(re.escape, keywords)) + ")")
+
+
+_PERSONA_PATTERNS = tuple((persona, keyword_regex(keywords)) for persona, keywords in PERSONA_KEYWORDS)
+_PROBLEM_TYPE_PATTERNS = tuple(
+    (problem_type, initial_score, keyword_regex(keywords))
+    for problem_type, initial_score, keywords in PROBLEM_TYPE_KEYWORDS
+)
+
+
+@lru_cache(maxsize=1024)
+def detect_persona(message_lower: str) -> str:
+    """Detect persona from a lowercased message (cached; repeated messages are O(1))."""
+    for persona, pattern in _PERSONA_PATTERNS:
+        if pattern.search(message_lower):
+            return persona
+    return "general"
+
+
+@lru_cache(maxsize=1024)
+def classify_problem_type(message_lower: str) -> Tuple[str, int]:
+    """Classify problem type from a lowercased message; returns (type, initial uncertainty score) (cached)."""
+    for problem_type, initial_score, pattern in _PROBLEM_TYPE_PATTERNS:
+        if pattern.search(message_lower):
+            return problem_type, initial_score
+    return "general", 50
@@ -1,10 +1,25 @@
+import atexit
 import os
+import threading
+from functools import lru_cache
 from neo4j import GraphDatabase, basic_auth
-from langchain_community.graphs import Neo4jGraph
 from langchain.chains import GraphCypherQAChain
 from langchain_anthropic import ChatAnthropic
 from langchain.prompts import PromptTemplate
 from larry_config import CLAUDE_MODEL, CLAUDE_MAX_TOKENS, CLAUDE_TEMPERATURE_PRECISE
+from larry_neo4j_tool import ParameterizedNeo4jGraph
+
+# orjson is optional: serializes graph results in C; the stdlib fallback emits the same JSON
+try:
+    import orjson
+
+    def _to_json(value) -> str:
+        return orjson.dumps(value, default=str).decode()
+except ImportError:
+    import json
+
+    def _to_json(value) -> str:
+        return json.dumps(value, default=str, ensure_ascii=False, separators=(",", ":"))
 
 # --- Configuration ---
 NEO4J_URI = os.getenv("NEO4J_URI")
@@ -12,69 +27,101 @@ NEO4J_USER = os.getenv("NEO4J_USER")
 NEO4J_PASSWORD = os.getenv("NEO4J_PASSWORD")
 NEO4J_DATABASE = os.getenv("NEO4J_DATABASE", "neo4j")
 
+# Custom prompt to guide the LLM for Cypher generation
+CYPHER_GENERATION_TEMPLATE = """
+    You are an expert Neo4j Cypher query generator. Your task is to translate a user's question into a single, valid, read-only Cypher query.
+    The graph schema is:
+    {schema}
+    
+    Focus on retrieving relevant nodes and relationships that could answer the question.
+    DO NOT make up properties or labels. The query MUST start with MATCH and end with RETURN.
+    DO NOT include any explanation or text outside of the Cypher query itself.
+    
+    Question: {question}
+    """
+
+CYPHER_PROMPT = PromptTemplate(
+    input_variables=["schema", "question"],
+    template=CYPHER_GENERATION_TEMPLATE,
+)
+
 # --- Neo4j Connection and Graph RAG ---
 
+_graph = None
+_graph_lock = threading.Lock()
+
 def get_neo4j_graph():
-    """Initializes and returns the LangChain Neo4jGraph object."""
+    """
+    Returns the shared LangChain Neo4jGraph object.
+
+    Built once per process (its driver pools connections, and the schema is
+    fetched at construction), then reused by every request. A failed
+    connection is not cached, so the next call retries.
+    """
+    global _graph
+    if _graph is not None:
+        return _graph
     if not all([NEO4J_URI, NEO4J_USER, NEO4J_PASSWORD]):
         return None
-    try:
-        graph = Neo4jGraph(
-            url=NEO4J_URI,
-            username=NEO4J_USER,
-            password=NEO4J_PASSWORD,
-            database=NEO4J_DATABASE
-        )
-        # Verify connection by fetching schema
-        graph.refresh_schema()
-        return graph
-    except Exception as e:
-        print(f"Neo4j connection failed: {e}")
-        return None
+    with _graph_lock:
+        if _graph is None:
+            try:
+                graph = ParameterizedNeo4jGraph(
+                    url=NEO4J_URI,
+                    username=NEO4J_USER,
+                    password=NEO4J_PASSWORD,
+                    database=NEO4J_DATABASE
+                )
+                # Verify connection by fetching schema
+                graph.refresh_schema()
+            except Exception as e:
+                print(f"Neo4j connection failed: {e}")
+                return None
+            atexit.register(graph.close)
+            _graph = graph
+    return _graph
 
-def get_neo4j_rag_context(user_message, persona, problem_type, api_key):
+@lru_cache(maxsize=4)
+def _get_qa_chain(graph):
     """
-    Uses LangChain's GraphCypherQAChain to generate Cypher and execute the query.
-    This provides the "Network-Effect" RAG context.
-    """
-    graph = get_neo4j_graph()
-    if not graph:
-        return None, "Neo4j is not configured or connection failed."
+    Builds the GraphCypherQAChain for a graph once and reuses it.
 
+    The chain captures the graph schema when it is built; call
+    refresh_neo4j_schema() after changing the graph's structure.
+    """
     # Use Claude for Cypher generation and QA (consistent with the rest of the app)
     llm = ChatAnthropic(
         model=CLAUDE_MODEL,
         temperature=CLAUDE_TEMPERATURE_PRECISE,  # Low temperature for deterministic Cypher generation
         max_tokens=CLAUDE_MAX_TOKENS
     )
-
-    # Custom prompt to guide the LLM for Cypher generation
-    CYPHER_GENERATION_TEMPLATE = """
-    You are an expert Neo4j Cypher query generator. Your task is to translate a user's question into a single, valid, read-only Cypher query.
-    The graph schema is:
-    {schema}
-    
-    Focus on retrieving relevant nodes and relationships that could answer the question.
-    DO NOT make up properties or labels. The query MUST start with MATCH and end with RETURN.
-    DO NOT include any explanation or text outside of the Cypher query itself.
-    
-    Question: {question}
-    """
-    
-    cypher_prompt = PromptTemplate(
-        input_variables=["schema", "question"],
-        template=CYPHER_GENERATION_TEMPLATE,
-    )
-
-    chain = GraphCypherQAChain.from_llm(
+    return GraphCypherQAChain.from_llm(
         llm=llm,
         graph=graph,
         verbose=False,
-        cypher_prompt=cypher_prompt,
+        cypher_prompt=CYPHER_PROMPT,
         return_intermediate_steps=True
     )
 
+def refresh_neo4j_schema():
+    """Re-reads the graph schema and rebuilds the QA chain on next use."""
+    graph = get_neo4j_graph()
+    if graph:
+        graph.refresh_schema()
+    _get_qa_chain.cache_clear()
+
+def get_neo4j_rag_context(user_message, persona, problem_type, api_key):
+    """
+    Uses LangChain's GraphCypherQAChain to generate Cypher and execute the query.
+    This provides the "Network-Effect" RAG context.
+    """
+    graph = get_neo4j_graph()
+    if not graph:
+        return None, "Neo4j is not configured or connection failed."
+
     try:
+        chain = _get_qa_chain(graph)
+
         # LangChain's GraphCypherQAChain will generate Cypher, execute it, and then
         # use the LLM to answer the question based on the result.
         # We only want the intermediate steps (Cypher and result) for RAG context.
@@ -82,7 +129,9 @@ def get_neo4j_rag_context(user_message, persona, problem_type, api_key):
         
         # Extract the generated Cypher and the graph result
         cypher_query = result["intermediate_steps"][0]["query"]
-        graph_result = result["intermediate_steps"][1]["context"]
+        # Compact JSON rather than the records' Python repr: cheaper to build
+        # and fewer prompt tokens
+        graph_result = _to_json(result["intermediate_steps"][1]["context"])
         
         # Format the context for the main RAG prompt
         formatted_context = f"""
@@ -3,9 +3,26 @@ Larry Neo4j RAG v2 - Using Pre-built Cypher Queries
 Much faster and more reliable than LLM-generated queries
 """
 
+import asyncio
+import atexit
+import logging
 import os
-from neo4j import GraphDatabase
-from larry_cypher_queries import CYPHER_QUERIES, select_query_for_question
+import threading
+import time
+from itertools import islice
+from neo4j import GraphDatabase, unit_of_work
+from larry_config import GRAPH_EMBEDDING_MODEL, NEO4J_RESULT_CACHE_TTL_SECONDS
+from larry_cypher_queries import (
+    CYPHER_QUERIES,
+    TTLCache,
+    freeze_record,
+    load_known_frameworks,
+    result_cache,
+    result_cache_key,
+    select_query_for_question,
+)
+from larry_gemini_client import embed_texts, get_client
+from larry_semantic_cache import normalize_question
 
 # Configuration
 NEO4J_URI = os.getenv("NEO4J_URI")
@@ -13,20 +30,63 @@ NEO4J_USER = os.getenv("NEO4J_USER")
 NEO4J_PASSWORD = os.getenv("NEO4J_PASSWORD")
 NEO4J_DATABASE = os.getenv("NEO4J_DATABASE", "neo4j")
 
+# Per-request diagnostics go through logging (lazy %-formatting, no stdout
+# lock per call); warnings still reach stderr when no handler is configured
+logger = logging.getLogger(__name__)
+
 # Connection timeout settings
 QUERY_TIMEOUT = 5  # 5 seconds max per query
+QUERY_FETCH_SIZE = 50  # Records pulled from the server per Bolt round-trip
+CONTEXT_MAX_RECORDS = 5  # The most records any _format_* method reads
+CONNECT_RETRY_SECONDS = 5  # get_shared_rag() waits this long after a failed connect...
+CONNECT_RETRY_MAX_SECONDS = 300  # ...doubling per consecutive failure up to this
+
+# Query-name keyword -> formatter method, checked in order
+_FORMATTER_KEYWORDS = (
+    ("framework", "_format_framework_results"),
+    ("problem_type", "_format_problem_type_results"),
+    ("author", "_format_author_results"),
+    ("portfolio", "_format_portfolio_results"),
+    ("learning", "_format_learning_path_results"),
+)
+
+
+def _formatter_for(query_name):
+    """Name of the LarryNeo4jRAG method that formats results of query_name"""
+    query_name = query_name.lower()
+    for keyword, formatter in _FORMATTER_KEYWORDS:
+        if keyword in query_name:
+            return formatter
+    return "_format_generic_results"
+
+
+# Resolved once for every library query; other names fall back to _formatter_for
+_FORMATTERS = {query_name: _formatter_for(query_name) for query_name in CYPHER_QUERIES}
 
 
 class LarryNeo4jRAG:
     """Fast, reliable Neo4j RAG using pre-built queries"""
 
-    def __init__(self, uri=None, user=None, password=None, database="neo4j"):
-        """Initialize Neo4j connection with timeout"""
+    def __init__(self, uri=None, user=None, password=None, database="neo4j", verify_on_init=False):
+        """
+        Initialize Neo4j connection with timeout
+
+        The driver connects lazily; pass verify_on_init=True (e.g. from a
+        health check) to probe the server with RETURN 1 up front.
+        """
         self.uri = uri or NEO4J_URI
         self.user = user or NEO4J_USER
         self.password = password or NEO4J_PASSWORD
         self.database = database
         self.driver = None
+        # Most questions map to a few (query, params) pairs, so repeats are
+        # answered without a round-trip: query results live in the driver's
+        # result_cache() (shared with run_query), formatted contexts here
+        self._contexts = TTLCache()
+        # monotonic time before which vector search is skipped (see vector_search)
+        self._vector_retry_at = 0.0
+        # monotonic time of the next framework-name load; None once loaded
+        self._frameworks_retry_at = 0.0
 
         if self.is_configured():
             try:
@@ -34,13 +94,16 @@ class LarryNeo4jRAG:
                     self.uri,
                     auth=(self.user, self.password),
                     max_connection_lifetime=30,
+                    max_connection_pool_size=50,
                     connection_acquisition_timeout=5
                 )
-                # Test connection
-                with self.driver.session(database=self.database) as session:
-                    session.run("RETURN 1", timeout=1)
+                if verify_on_init:
+                    with self.driver.session(database=self.database) as session:
+                        session.run("RETURN 1", timeout=1)
             except Exception as e:
                 print(f"Neo4j connection failed: {e}")
+                if self.driver is not None:
+                    self.driver.close()  # release the pool the failed probe opened
                 self.driver = None
 
     def is_configured(self):
@@ -51,8 +114,15 @@ class LarryNeo4jRAG:
         """Close the driver connection"""
         if self.driver:
             self.driver.close()
+        self.clear_cache()
+
+    def clear_cache(self):
+        """Forget cached results and contexts (call after editing the graph)"""
+        if self.driver:
+            result_cache(self.driver).clear()
+        self._contexts.clear()
 
-    def execute_query(self, query, parameters=None, timeout=QUERY_TIMEOUT):
+    def execute_query(self, query, parameters=None, timeout=QUERY_TIMEOUT, max_records=None):
         """
         Execute a Cypher query with timeout
 
@@ -60,20 +130,36 @@ class LarryNeo4jRAG:
             query: Cypher query string
             parameters: Query parameters dict
             timeout: Query timeout in seconds
+            max_records: Stop after this many records and discard the rest
+                (None reads them all)
 
         Returns:
-            List of records or None if error
+            Tuple of read-only records or None if error
         """
         if not self.driver:
             return None
 
+        results = result_cache(self.driver)
+        key = result_cache_key(self.database, query, parameters, max_records)
+        if key is not None:
+            cached = results.get(key)
+            if cached is not None:
+                return cached
+
         try:
-            with self.driver.session(database=self.database) as session:
+            with self.driver.session(database=self.database, fetch_size=QUERY_FETCH_SIZE) as session:
                 result = session.run(query, parameters or {}, timeout=timeout)
-                return [record.data() for record in result]
+                # Library queries return scalar projections, so a shallow
+                # copy suffices; record.data() would walk every value
+                records = tuple(map(freeze_record, islice(result, max_records)))
+                if max_records is not None:
+                    result.consume()  # the server drops the unread tail
         except Exception as e:
-            print(f"Query execution error: {e}")
+            logger.warning("Query execution error: %s", e)
             return None
+        if key is not None:
+            results.put(key, records)
+        return records
 
     def get_rag_context(self, user_message, persona="general", problem_type="general"):
         """
@@ -90,28 +176,169 @@ class LarryNeo4jRAG:
         if not self.driver:
             return None
 
+        cache_key = (user_message.lower().strip(), persona, problem_type)
+        context = self._contexts.get(cache_key)
+        if context is not None:
+            return context
+
+        self._load_framework_names()
         try:
             # Select the best query for this question
             query_name, query, suggested_params = select_query_for_question(
                 user_message, persona, problem_type
             )
 
-            print(f"Neo4j RAG: Using query '{query_name}' with params {suggested_params}")
+            logger.debug("Neo4j RAG: Using query '%s' with params %s", query_name, suggested_params)
 
-            # Execute the query
-            results = self.execute_query(query, suggested_params)
+            results = None
+            if query_name == "semantic_framework_search":
+                # Prefer true semantic (vector index) matching; fulltext is the fallback
+                results = self.vector_search(user_message, max_records=CONTEXT_MAX_RECORDS)
 
+            # Execute the query (only as many records as the formatters read)
             if not results:
-                return None
+                results = self.execute_query(query, suggested_params, max_records=CONTEXT_MAX_RECORDS)
 
-            # Format results into readable context
-            context = self._format_results(query_name, results)
-            return context
+            return self._remember_context(cache_key, query_name, results)
 
         except Exception as e:
-            print(f"RAG context error: {e}")
+            logger.warning("RAG context error: %s", e)
             return None
 
+    async def execute_query_async(self, query, parameters=None, timeout=QUERY_TIMEOUT, max_records=None):
+        """
+        execute_query for async callers
+
+        Runs in a worker thread, so the event loop is not blocked, while
+        sharing the pooled driver and result cache with the sync path.
+        """
+        return await asyncio.to_thread(self.execute_query, query, parameters, timeout, max_records)
+
+    async def get_rag_context_async(self, user_message, persona="general", problem_type="general"):
+        """get_rag_context for async callers (runs in a worker thread)"""
+        return await asyncio.to_thread(self.get_rag_context, user_message, persona, problem_type)
+
+    def execute_query_many(self, query, parameter_list, timeout=QUERY_TIMEOUT, max_records=None):
+        """
+        Execute one Cypher query for several parameter sets in a single read transaction
+
+        Args:
+            query: Cypher query string
+            parameter_list: Parameter dicts, one per run
+            timeout: Transaction timeout in seconds
+            max_records: Records kept per parameter set (None keeps all)
+
+        Returns:
+            One list of records per parameter set, or None if error
+        """
+        if not self.driver:
+            return None
+
+        @unit_of_work(timeout=timeout)
+        def run_all(tx):
+            record_sets = []
+            for parameters in parameter_list:
+                result = tx.run(query, parameters or {})
+                record_sets.append([dict(record) for record in islice(result, max_records)])
+                if max_records is not None:
+                    result.consume()
+            return record_sets
+
+        try:
+            with self.driver.session(database=self.database, fetch_size=QUERY_FETCH_SIZE) as session:
+                return session.execute_read(run_all)
+        except Exception as e:
+            logger.warning("Batch query execution error: %s", e)
+            return None
+
+    def get_rag_context_batch(self, requests):
+        """
+        Get RAG context for several questions at once
+
+        Questions that select the same library query share one session and
+        one read transaction instead of each acquiring their own.
+
+        Args:
+            requests: (user_message, persona, problem_type) tuples
+
+        Returns:
+            Formatted context string or None per request, in order
+        """
+        contexts = [None] * len(requests)
+        if not self.driver:
+            return contexts
+
+        self._load_framework_names()
+        groups = {}  # query_name -> (query, [(index, cache_key, params)])
+        semantic = []  # (index, cache_key, user_message, query, params)
+        for index, (user_message, persona, problem_type) in enumerate(requests):
+            cache_key = (user_message.lower().strip(), persona, problem_type)
+            contexts[index] = self._contexts.get(cache_key)
+            if contexts[index] is not None:
+                continue
+
+            query_name, query, suggested_params = select_query_for_question(
+                user_message, persona, problem_type
+            )
+            if query_name == "semantic_framework_search":
+                semantic.append((index, cache_key, user_message, query, suggested_params))
+                continue
+            groups.setdefault(query_name, (query, []))[1].append((index, cache_key, suggested_params))
+
+        if semantic:
+            # Vector search first, with every question embedded in one request;
+            # fulltext is the fallback
+            query_name = "semantic_framework_search"
+            embeddings = [None] * len(semantic)
+            if time.monotonic() >= self._vector_retry_at:
+                embeddings = self._embed_questions([user_message for _, _, user_message, _, _ in semantic])
+            for (index, cache_key, user_message, query, params), embedding in zip(semantic, embeddings):
+                if embedding is not None:
+                    contexts[index] = self._remember_context(
+                        cache_key, query_name,
+                        self.vector_search(user_message, max_records=CONTEXT_MAX_RECORDS, embedding=embedding)
+                    )
+                if contexts[index] is None:
+                    groups.setdefault(query_name, (query, []))[1].append((index, cache_key, params))
+
+        for query_name, (query, members) in groups.items():
+            result_sets = self.execute_query_many(
+                query, [params for _, _, params in members], max_records=CONTEXT_MAX_RECORDS
+            )
+            if result_sets is None:
+                continue
+            for (index, cache_key, _), results in zip(members, result_sets):
+                contexts[index] = self._remember_context(cache_key, query_name, results)
+
+        return contexts
+
+    def _load_framework_names(self):
+        """
+        Teach the question router every framework name in the graph
+
+        Runs on the first routed question rather than in __init__, so building
+        an instance makes no round-trip; a failed load is retried after
+        NEO4J_RESULT_CACHE_TTL_SECONDS.
+        """
+        retry_at = self._frameworks_retry_at
+        if retry_at is None or time.monotonic() < retry_at:
+            return
+        try:
+            load_known_frameworks(self.driver, self.database)
+        except Exception as e:
+            logger.warning("Loading framework names failed: %s", e)
+            self._frameworks_retry_at = time.monotonic() + NEO4J_RESULT_CACHE_TTL_SECONDS
+            return
+        self._frameworks_retry_at = None
+
+    def _remember_context(self, cache_key, query_name, results):
+        """Format results into readable context and cache it (None if no results)"""
+        if not results:
+            return None
+        context = self._format_results(query_name, results)
+        self._contexts.put(cache_key, context)
+        return context
+
     def _format_results(self, query_name, results):
         """Format query results into readable context"""
 
@@ -119,43 +346,31 @@ class LarryNeo4jRAG:
             return "No relevant information found in knowledge graph."
 
         # Different formatting based on query type
-        if "framework" in query_name.lower():
-            return self._format_framework_results(results)
-        elif "problem_type" in query_name.lower():
-            return self._format_problem_type_results(results)
-        elif "author" in query_name.lower():
-            return self._format_author_results(results)
-        elif "portfolio" in query_name.lower():
-            return self._format_portfolio_results(results)
-        elif "learning" in query_name.lower():
-            return self._format_learning_path_results(results)
-        else:
-            return self._format_generic_results(results)
+        formatter = _FORMATTERS.get(query_name) or _formatter_for(query_name)
+        return getattr(self, formatter)(results)
+
+    # The _format_* methods build one string per record (optional lines
+    # folded in with conditional f-strings) and join once at the end; they
+    # are only called with non-empty results
 
     def _format_framework_results(self, results):
         """Format framework query results"""
         context_parts = ["**Relevant Frameworks from Knowledge Graph:**\n"]
 
-        for i, record in enumerate(results[:5], 1):
-            framework = record.get('framework', 'Unknown')
+        for i, record in enumerate(islice(results, 5), 1):
             description = record.get('description', '')
-            difficulty = record.get('difficulty', '')
             problem_types = record.get('problem_types', [])
-
-            context_parts.append(f"{i}. **{framework}** ({difficulty})")
-            if description:
-                context_parts.append(f"   - {description}")
-            if problem_types:
-                context_parts.append(f"   - Addresses: {', '.join(problem_types)}")
-            context_parts.append("")
+            context_parts.append(
+                f"{i}. **{record.get('framework', 'Unknown')}** ({record.get('difficulty', '')})"
+                + (f"\n   - {description}" if description else "")
+                + (f"\n   - Addresses: {', '.join(problem_types)}" if problem_types else "")
+                + "\n"
+            )
 
         return "\n".join(context_parts)
 
     def _format_problem_type_results(self, results):
-        """Format problem type query results"""
-        if not results:
-            return "No problem type information found."
-
+        """Format problem type query results (_format_results guarantees at least one)"""
         record = results[0]
         problem_type = record.get('problem_type', 'Unknown')
         description = record.get('description', '')
@@ -179,18 +394,15 @@ class LarryNeo4jRAG:
         """Format author query results"""
         context_parts = ["**Author Information:**\n"]
 
-        for record in results[:3]:
-            author = record.get('author', 'Unknown')
-            expertise = record.get('expertise', '')
+        for record in islice(results, 3):
             books = record.get('books', [])
             frameworks = record.get('frameworks', [])
-
-            context_parts.append(f"**{author}** - {expertise}")
-            if books:
-                context_parts.append(f"  Key Books: {', '.join(books[:3])}")
-            if frameworks:
-                context_parts.append(f"  Associated Frameworks: {', '.join(frameworks)}")
-            context_parts.append("")
+            context_parts.append(
+                f"**{record.get('author', 'Unknown')}** - {record.get('expertise', '')}"
+                + (f"\n  Key Books: {', '.join(books[:3])}" if books else "")
+                + (f"\n  Associated Frameworks: {', '.join(frameworks)}" if frameworks else "")
+                + "\n"
+            )
 
         return "\n".join(context_parts)
 
@@ -199,16 +411,13 @@ class LarryNeo4jRAG:
         context_parts = ["**Innovation Portfolio Horizons:**\n"]
 
         for record in results:
-            horizon = record.get('horizon', 'Unknown')
-            description = record.get('description', '')
-            allocation = record.get('allocation', '')
             frameworks = record.get('frameworks', [])
-
-            context_parts.append(f"**{horizon}** ({allocation})")
-            context_parts.append(f"  {description}")
-            if frameworks:
-                context_parts.append(f"  Example Frameworks: {', '.join(frameworks[:3])}")
-            context_parts.append("")
+            context_parts.append(
+                f"**{record.get('horizon', 'Unknown')}** ({record.get('allocation', '')})\n"
+                f"  {record.get('description', '')}"
+                + (f"\n  Example Frameworks: {', '.join(frameworks[:3])}" if frameworks else "")
+                + "\n"
+            )
 
         return "\n".join(context_parts)
 
@@ -216,15 +425,11 @@ class LarryNeo4jRAG:
         """Format learning path results"""
         context_parts = ["**Recommended Learning Path:**\n"]
 
-        for i, record in enumerate(results[:5], 1):
-            framework = record.get('framework', 'Unknown')
-            level = record.get('level', '')
-            problem_type = record.get('problem_type', '')
-            time = record.get('time_commitment', '')
-
-            context_parts.append(f"{i}. {framework} ({level})")
-            context_parts.append(f"   Problem Type: {problem_type} | Time: {time}")
-            context_parts.append("")
+        for i, record in enumerate(islice(results, 5), 1):
+            context_parts.append(
+                f"{i}. {record.get('framework', 'Unknown')} ({record.get('level', '')})\n"
+                f"   Problem Type: {record.get('problem_type', '')} | Time: {record.get('time_commitment', '')}\n"
+            )
 
         return "\n".join(context_parts)
 
@@ -232,7 +437,7 @@ class LarryNeo4jRAG:
         """Format generic query results"""
         context_parts = ["**Knowledge Graph Results:**\n"]
 
-        for i, record in enumerate(results[:5], 1):
+        for i, record in enumerate(islice(results, 5), 1):
             # Get the most relevant fields
             main_field = None
             for key in ['framework', 'concept', 'name', 'title']:
@@ -241,14 +446,9 @@ class LarryNeo4jRAG:
                     break
 
             if main_field:
-                context_parts.append(f"{i}. {main_field}")
-
                 # Add description if available
                 description = record.get('description', '')
-                if description:
-                    context_parts.append(f"   {description}")
-
-                context_parts.append("")
+                context_parts.append(f"{i}. {main_field}" + (f"\n   {description}" if description else "") + "\n")
 
         return "\n".join(context_parts)
 
@@ -257,10 +457,54 @@ class LarryNeo4jRAG:
         query = CYPHER_QUERIES["enrich_response_with_context"]
         results = self.execute_query(query, {"framework_name": framework_name})
 
-        if results and len(results) > 0:
-            return results[0]
+        if results:
+            return dict(results[0])  # the cached record itself is read-only
         return None
 
+    def vector_search(self, text, query_name="vector_framework_search", max_records=None, embedding=None):
+        """
+        Nearest-neighbour search over node embeddings
+
+        Embeds `text` once with Gemini (unless its `embedding` is passed in)
+        and runs an HNSW vector-index query (keeping at most max_records hits).
+        Returns None if no Gemini client is available or the graph has no
+        vector index / embeddings yet. After a failure, vector search is
+        skipped for NEO4J_RESULT_CACHE_TTL_SECONDS rather than failing again
+        on every question.
+        """
+        if time.monotonic() < self._vector_retry_at:
+            return None
+        if embedding is None:
+            embedding = self._embed_questions([text])[0]
+            if embedding is None:
+                return None
+
+        results = self.execute_query(CYPHER_QUERIES[query_name], {"query_embedding": embedding}, max_records=max_records)
+        if results is None:
+            self._disable_vector_search("vector index query failed")
+        return results
+
+    def _embed_questions(self, texts):
+        """
+        Embed questions in one request, one embedding (or None) per text
+
+        Questions are normalized as the response cache does, so a question it
+        has already embedded is not sent to Gemini again.
+        """
+        client = get_client()
+        if client is None:
+            return [None] * len(texts)
+        try:
+            return embed_texts(client, GRAPH_EMBEDDING_MODEL, [normalize_question(text) for text in texts])
+        except Exception as e:
+            self._disable_vector_search(f"question embedding failed: {e}")
+            return [None] * len(texts)
+
+    def _disable_vector_search(self, reason):
+        """Skip vector search until the result-cache TTL has passed"""
+        self._vector_retry_at = time.monotonic() + NEO4J_RESULT_CACHE_TTL_SECONDS
+        logger.warning("Vector search disabled for %ss: %s", NEO4J_RESULT_CACHE_TTL_SECONDS, reason)
+
     def search_by_keyword(self, keyword):
         """Simple keyword search across all content"""
         query = CYPHER_QUERIES["semantic_framework_search"]
@@ -277,10 +521,44 @@ def is_neo4j_configured():
     return all([NEO4J_URI, NEO4J_USER, NEO4J_PASSWORD])
 
 
+_shared_rag = None
+_shared_rag_lock = threading.Lock()
+# (last failed instance, consecutive failures, monotonic time of the next attempt)
+_shared_rag_failure = (None, 0, 0.0)
+
+
+def get_shared_rag():
+    """
+    Return the process-wide LarryNeo4jRAG
+
+    The driver pools its connections, so one instance serves every request
+    instead of paying a TCP/TLS handshake and Bolt HELLO per message. A
+    failed connection is not cached; the next attempt waits
+    CONNECT_RETRY_SECONDS, doubling per consecutive failure, and until then
+    the failed (driverless) instance is returned.
+    """
+    global _shared_rag, _shared_rag_failure
+    if _shared_rag is None:
+        with _shared_rag_lock:
+            if _shared_rag is None:
+                failed, failures, retry_at = _shared_rag_failure
+                if failed is not None and time.monotonic() < retry_at:
+                    return failed
+                rag = LarryNeo4jRAG()
+                if not rag.driver:
+                    delay = min(CONNECT_RETRY_SECONDS * 2 ** failures, CONNECT_RETRY_MAX_SECONDS)
+                    _shared_rag_failure = (rag, failures + 1, time.monotonic() + delay)
+                    return rag
+                atexit.register(rag.close)
+                _shared_rag = rag
+                _shared_rag_failure = (None, 0, 0.0)
+    return _shared_rag
+
+
 def get_neo4j_rag_context_fast(user_message, persona="general", problem_type="general"):
     """
     Quick function to get Neo4j RAG context
-    Auto-manages connection and handles errors gracefully
+    Reuses the shared connection and handles errors gracefully
 
     Returns:
         Formatted context string or None
@@ -288,19 +566,14 @@ def get_neo4j_rag_context_fast(user_message, persona="general", problem_type="ge
     if not is_neo4j_configured():
         return None
 
-    rag = None
     try:
-        rag = LarryNeo4jRAG()
+        rag = get_shared_rag()
         if rag.driver:
-            context = rag.get_rag_context(user_message, persona, problem_type)
-            return context
+            return rag.get_rag_context(user_message, persona, problem_type)
         return None
     except Exception as e:
-        print(f"Neo4j RAG error: {e}")
+        logger.warning("Neo4j RAG error: %s", e)
         return None
-    finally:
-        if rag:
-            rag.close()
 
 
 # ============================================================================
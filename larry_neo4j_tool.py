@@ -3,14 +3,81 @@ Neo4j Query Tool for MCP-style Natural Language to Cypher Conversion
 This tool enables the agent to query Neo4j knowledge graphs using natural language.
 """
 
+import asyncio
+import atexit
+import logging
 import os
+import threading
+import time
+from collections import OrderedDict
 from typing import Optional
+from pydantic import PrivateAttr
 from langchain_core.tools import BaseTool
 from langchain_community.graphs import Neo4jGraph
 from langchain.chains import GraphCypherQAChain
 from langchain_anthropic import ChatAnthropic
 from langchain.prompts import PromptTemplate
-from larry_config import CLAUDE_MODEL, CLAUDE_MAX_TOKENS, CLAUDE_TEMPERATURE_PRECISE
+from larry_config import CLAUDE_MODEL, CLAUDE_MAX_TOKENS, CLAUDE_TEMPERATURE_PRECISE, NEO4J_SCHEMA_CACHE_TTL_SECONDS
+from larry_cypher_queries import ensure_limit, parameterize_literals
+
+# Per-query diagnostics go through logging; one-time setup messages stay on stdout
+logger = logging.getLogger(__name__)
+
+# Generated queries slower than this are logged (usually a missing index or a bad plan)
+SLOW_QUERY_SECONDS = 1.0
+
+NOT_CONFIGURED_MESSAGE = "Neo4j is not configured. Please set NEO4J_URI, NEO4J_USER, and NEO4J_PASSWORD environment variables."
+
+# Generated Cypher kept per tool, keyed by normalized question (oldest evicted first)
+CYPHER_CACHE_MAX_ENTRIES = 256
+
+
+# Custom Cypher generation prompt (built once, shared by every query)
+CYPHER_PROMPT = PromptTemplate(
+    input_variables=["schema", "question"],
+    template="""You are a Neo4j Cypher expert. Generate a Cypher query to answer the user's question.
+                
+Database Schema:
+{schema}
+
+Question: {question}
+
+Instructions:
+- Generate ONLY the Cypher query, no explanations
+- Use the schema to understand available nodes and relationships
+- Make the query efficient and specific
+- Use LIMIT to prevent returning too many results (default: 25)
+- Return relevant properties of nodes and relationships
+- AVOID UNION queries - use OR conditions instead
+- If you must use UNION, ensure ALL queries return the EXACT SAME column names
+- Prefer simple MATCH queries with WHERE clauses over complex UNIONs
+- Use labels() and properties() functions to explore unknown schemas
+
+Cypher Query:"""
+)
+
+
+class ParameterizedNeo4jGraph(Neo4jGraph):
+    """
+    Neo4jGraph that parameterizes the CONTAINS literals of generated Cypher.
+
+    Text2Cypher queries mostly differ only in the text they search for, so
+    sending that text as parameters lets the server reuse cached plans
+    instead of parsing and planning every query. Generated queries without
+    a LIMIT are capped at GENERATED_QUERY_LIMIT rows, since the chain only
+    uses the first few anyway.
+    """
+
+    def query(self, query: str, params: Optional[dict] = None, *args, **kwargs):
+        # Schema introspection (CALL apoc.meta.data() etc.) passes through untouched
+        if not params and not query.lstrip().upper().startswith("CALL"):
+            query, params = parameterize_literals(ensure_limit(query))
+        started = time.perf_counter()
+        result = super().query(query, params, *args, **kwargs)
+        elapsed = time.perf_counter() - started
+        if elapsed > SLOW_QUERY_SECONDS:
+            logger.warning("Slow Neo4j query (%.0f ms): %s", elapsed * 1000, query)
+        return result
 
 
 class Neo4jQueryTool(BaseTool):
@@ -44,6 +111,12 @@ class Neo4jQueryTool(BaseTool):
     
     graph: Optional[Neo4jGraph] = None
     llm: Optional[ChatAnthropic] = None
+    chain: Optional[GraphCypherQAChain] = None
+    # normalized question -> Cypher the chain generated for it; valid for the
+    # schema the chain was built with, so it is reset with the chain
+    cypher_cache: Optional[OrderedDict] = None
+    # _run (tool threads) and _arun (event loop) both read and write the cache
+    _cypher_cache_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
     
     def __init__(self):
         super().__init__()
@@ -62,7 +135,7 @@ class Neo4jQueryTool(BaseTool):
         
         try:
             # Initialize Neo4j graph connection
-            self.graph = Neo4jGraph(
+            self.graph = ParameterizedNeo4jGraph(
                 url=neo4j_uri,
                 username=neo4j_user,
                 password=neo4j_password,
@@ -72,6 +145,9 @@ class Neo4jQueryTool(BaseTool):
             # Verify connection and fetch schema
             self.graph.refresh_schema()
             print(f"✅ Neo4j connected successfully to {neo4j_database}")
+
+            # One driver (and connection pool) per tool, reused by every _run call
+            atexit.register(self.close)
             
             # Initialize LLM for Cypher generation
             self.llm = ChatAnthropic(
@@ -79,62 +155,114 @@ class Neo4jQueryTool(BaseTool):
                 temperature=CLAUDE_TEMPERATURE_PRECISE,
                 max_tokens=CLAUDE_MAX_TOKENS
             )
+
+            # Create GraphCypherQAChain for Text2Cypher once; it captures the
+            # schema fetched above, so _run makes no schema round-trip
+            self.chain = GraphCypherQAChain.from_llm(
+                llm=self.llm,
+                graph=self.graph,
+                verbose=True,
+                cypher_prompt=CYPHER_PROMPT,
+                return_intermediate_steps=True,
+                allow_dangerous_requests=True  # Required for write queries if needed
+            )
+            self.cypher_cache = OrderedDict()
             
         except Exception as e:
             print(f"❌ Neo4j initialization failed: {e}")
             self.graph = None
             self.llm = None
+            self.chain = None
+            self.cypher_cache = None
     
     def _run(self, query: str) -> str:
         """Execute the natural language query against Neo4j."""
-        if not self.graph or not self.llm:
-            return "Neo4j is not configured. Please set NEO4J_URI, NEO4J_USER, and NEO4J_PASSWORD environment variables."
+        if not self.chain:
+            return NOT_CONFIGURED_MESSAGE
         
         try:
-            # Create custom Cypher generation prompt
-            cypher_prompt = PromptTemplate(
-                input_variables=["schema", "question"],
-                template="""You are a Neo4j Cypher expert. Generate a Cypher query to answer the user's question.
+            # A question seen before reuses its Cypher: no Cypher-generation
+            # LLM call, just the graph query and the answer step
+            cache_key = self._cache_key(query)
+            cypher_query = self._cached_cypher(cache_key)
+            if cypher_query is not None:
+                records = self.graph.query(cypher_query)
+                answer = self.chain.qa_chain.invoke(self._qa_inputs(query, records))
+                return self._format_cached(cypher_query, answer)
+
+            # Execute the query
+            return self._format_chain_result(cache_key, self.chain.invoke({"query": query}))
                 
-Database Schema:
-{schema}
+        except Exception as e:
+            return self._error_response(e)
+    
+    async def _arun(self, query: str) -> str:
+        """
+        Async version of _run.
 
-Question: {question}
+        The chain and graph calls are blocking, so they run in worker threads
+        and the event loop keeps serving other requests meanwhile.
+        """
+        if not self.chain:
+            return NOT_CONFIGURED_MESSAGE
 
-Instructions:
-- Generate ONLY the Cypher query, no explanations
-- Use the schema to understand available nodes and relationships
-- Make the query efficient and specific
-- Use LIMIT to prevent returning too many results (default: 25)
-- Return relevant properties of nodes and relationships
-- AVOID UNION queries - use OR conditions instead
-- If you must use UNION, ensure ALL queries return the EXACT SAME column names
-- Prefer simple MATCH queries with WHERE clauses over complex UNIONs
-- Use labels() and properties() functions to explore unknown schemas
+        try:
+            cache_key = self._cache_key(query)
+            cypher_query = self._cached_cypher(cache_key)
+            if cypher_query is not None:
+                records = await asyncio.to_thread(self.graph.query, cypher_query)
+                answer = await self.chain.qa_chain.ainvoke(self._qa_inputs(query, records))
+                return self._format_cached(cypher_query, answer)
 
-Cypher Query:"""
-            )
-            
-            # Create GraphCypherQAChain for Text2Cypher
-            chain = GraphCypherQAChain.from_llm(
-                llm=self.llm,
-                graph=self.graph,
-                verbose=True,
-                cypher_prompt=cypher_prompt,
-                return_intermediate_steps=True,
-                allow_dangerous_requests=True  # Required for write queries if needed
-            )
-            
-            # Execute the query
-            result = chain.invoke({"query": query})
+            return self._format_chain_result(cache_key, await self.chain.ainvoke({"query": query}))
+
+        except Exception as e:
+            return self._error_response(e)
+
+    @staticmethod
+    def _cache_key(query: str) -> str:
+        return " ".join(query.casefold().split())
+
+    def _cached_cypher(self, cache_key: str) -> Optional[str]:
+        with self._cypher_cache_lock:
+            cypher_query = self.cypher_cache.get(cache_key)
+            if cypher_query is not None:
+                self.cypher_cache.move_to_end(cache_key)
+        return cypher_query
+
+    def _qa_inputs(self, query: str, records: list) -> dict:
+        """Inputs for the chain's answer step, as GraphCypherQAChain builds them"""
+        return {"question": query, "context": records[: self.chain.top_k]}
+
+    def _format_cached(self, cypher_query: str, answer) -> str:
+        """Format the chain's answer over the results of a cached Cypher query"""
+        # LLMChain answer steps return a dict, runnable ones the text itself
+        if isinstance(answer, dict):
+            answer = answer[self.chain.qa_chain.output_key]
+        return f"""**Query Results:**
+
+{answer}
+
+*Generated Cypher (cached):*
+```cypher
+{cypher_query}
+```
+"""
+
+    def _format_chain_result(self, cache_key: str, result: dict) -> str:
+        """Format a GraphCypherQAChain result and remember its Cypher"""
+        # Extract results
+        if "intermediate_steps" in result and len(result["intermediate_steps"]) > 0:
+            cypher_query = result["intermediate_steps"][0].get("query", "")
+            graph_result = result.get("result", "")
+            if cypher_query:
+                with self._cypher_cache_lock:
+                    self.cypher_cache[cache_key] = cypher_query
+                    if len(self.cypher_cache) > CYPHER_CACHE_MAX_ENTRIES:
+                        self.cypher_cache.popitem(last=False)
             
-            # Extract results
-            if "intermediate_steps" in result and len(result["intermediate_steps"]) > 0:
-                cypher_query = result["intermediate_steps"][0].get("query", "")
-                graph_result = result.get("result", "")
-                
-                # Format response
-                response = f"""**Query Results:**
+            # Format response
+            response = f"""**Query Results:**
 
 {graph_result}
 
@@ -143,18 +271,25 @@ Cypher Query:"""
 {cypher_query}
 ```
 """
-                return response
-            else:
-                return result.get("result", "No results found in the knowledge graph.")
-                
-        except Exception as e:
-            error_msg = f"Error querying Neo4j: {str(e)}"
-            print(f"❌ {error_msg}")
-            return f"I encountered an error while querying the knowledge graph: {str(e)}"
-    
-    async def _arun(self, query: str) -> str:
-        """Async version of _run."""
-        return self._run(query)
+            return response
+        else:
+            return result.get("result", "No results found in the knowledge graph.")
+
+    @staticmethod
+    def _error_response(e: Exception) -> str:
+        logger.error("Error querying Neo4j: %s", e)
+        return f"I encountered an error while querying the knowledge graph: {str(e)}"
+
+    def close(self):
+        """Close the Neo4j driver and its pooled connections (safe to call twice)."""
+        if self.graph is not None:
+            try:
+                self.graph.close()
+            except Exception as e:
+                print(f"⚠️ Failed to close Neo4j driver: {e}")
+            self.graph = None
+            self.chain = None
+            self.cypher_cache = None
 
 
 def is_neo4j_configured() -> bool:
@@ -166,20 +301,35 @@ def is_neo4j_configured() -> bool:
     ])
 
 
+# (expiry, schema) of the last get_neo4j_schema() introspection
+_schema_cache = (0.0, None)
+
+
 def get_neo4j_schema() -> Optional[str]:
-    """Get the Neo4j database schema for display purposes."""
+    """
+    Get the Neo4j database schema for display purposes.
+
+    Uses the shared graph from larry_neo4j_rag and re-runs the schema
+    introspection queries at most every NEO4J_SCHEMA_CACHE_TTL_SECONDS.
+    """
+    global _schema_cache
     if not is_neo4j_configured():
         return None
-    
+
+    expiry, schema = _schema_cache
+    if schema is not None and time.monotonic() < expiry:
+        return schema
+
+    # Imported here: larry_neo4j_rag imports this module
+    from larry_neo4j_rag import get_neo4j_graph
+
+    graph = get_neo4j_graph()
+    if graph is None:
+        return None
     try:
-        graph = Neo4jGraph(
-            url=os.getenv("NEO4J_URI"),
-            username=os.getenv("NEO4J_USER"),
-            password=os.getenv("NEO4J_PASSWORD"),
-            database=os.getenv("NEO4J_DATABASE", "neo4j")
-        )
         graph.refresh_schema()
-        return graph.schema
     except Exception as e:
         print(f"Failed to retrieve Neo4j schema: {e}")
         return None
+    _schema_cache = (time.monotonic() + NEO4J_SCHEMA_CACHE_TTL_SECONDS, graph.schema)
+    return graph.schema
@@ -4,6 +4,7 @@ Routes queries to the appropriate tool: Gemini File Search (default), Neo4j, or
 """
 
 import re
+from functools import lru_cache
 from typing import Literal
 
 QueryRoute = Literal["file_search", "neo4j", "web_search"]
@@ -19,8 +20,12 @@ def route_query(user_message: str) -> QueryRoute:
     Returns:
         "file_search" (default), "neo4j", or "web_search"
     """
-    message_lower = user_message.lower()
-    
+    return _route_normalized(user_message.strip().lower())
+
+
+@lru_cache(maxsize=512)
+def _route_normalized(message_lower: str) -> QueryRoute:
+    """Route an already stripped + lowercased message (cached)."""
     # --- Neo4j Knowledge Graph Triggers ---
     neo4j_keywords = [
         "knowledge graph",
@@ -0,0 +1,148 @@
+"""
+Larry Navigator - Semantic Response Cache
+Skips Gemini generation for repeated or near-duplicate questions
+"""
+
+import hashlib
+import math
+import threading
+from collections import OrderedDict
+from operator import mul
+from typing import List, Optional, Tuple
+
+from larry_config import (
+    SEMANTIC_CACHE_EMBEDDING_MODEL,
+    SEMANTIC_CACHE_MAX_ENTRIES,
+    SEMANTIC_CACHE_THRESHOLD,
+)
+from larry_gemini_client import embed_texts
+
+
+def normalize_question(question: str) -> str:
+    """Lowercase, collapse whitespace and drop trailing punctuation."""
+    return " ".join(question.lower().split()).rstrip("?!. ")
+
+
+class SemanticCache:
+    """
+    Two-tier, in-process response cache.
+
+    Tier 1 is an exact match on a hash of (persona, question_type, normalized
+    question). Tier 2 embeds the question and returns the cached answer of
+    the most similar earlier question in the same persona / question-type
+    bucket if its cosine similarity is at least `threshold`.
+
+    Usage:
+        cache = SemanticCache(client)
+        response, embedding = cache.get(persona, question_type, question)
+        if response is None:
+            response = ...  # call Gemini
+            cache.put(persona, question_type, question, response, embedding)
+    """
+
+    def __init__(
+        self,
+        client,
+        threshold: float = SEMANTIC_CACHE_THRESHOLD,
+        max_entries: int = SEMANTIC_CACHE_MAX_ENTRIES,
+        embedding_model: str = SEMANTIC_CACHE_EMBEDDING_MODEL
+    ):
+        """
+        Args:
+            client: google-genai Client used for embeddings (None disables tier 2)
+            threshold: Minimum cosine similarity for a semantic hit (0.0-1.0)
+            max_entries: Cached responses kept per tier (oldest evicted first)
+            embedding_model: Gemini embedding model name
+        """
+        self.client = client
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.embedding_model = embedding_model
+        self._exact = OrderedDict()  # key hash -> response
+        self._vectors = OrderedDict()  # key hash -> (bucket, unit vector, response)
+        # achat() looks entries up from worker threads while put() runs on the loop
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(persona: str, question_type: str, normalized: str) -> str:
+        return hashlib.blake2b(
+            f"{persona}\0{question_type}\0{normalized}".encode(), digest_size=16
+        ).hexdigest()
+
+    @staticmethod
+    def _unit(values: List[float]) -> Optional[List[float]]:
+        norm = math.sqrt(sum(map(mul, values, values)))
+        return [v / norm for v in values] if norm else None
+
+    def _embed(self, normalized: str) -> Optional[List[float]]:
+        """Return the unit-length embedding of a question, or None if unavailable."""
+        if self.client is None:
+            return None
+        try:
+            return self._unit(embed_texts(self.client, self.embedding_model, [normalized])[0])
+        except Exception as e:
+            print(f"Semantic cache embedding failed: {e}")
+            return None
+
+    def get(self, persona: str, question_type: str, question: str) -> Tuple[Optional[str], Optional[List[float]]]:
+        """
+        Look up a cached response.
+
+        Returns:
+            (response or None, question embedding or None). Pass the embedding
+            back to put() on a miss so the question is not embedded twice.
+        """
+        normalized = normalize_question(question)
+        key = self._key(persona, question_type, normalized)
+        with self._lock:
+            response = self._exact.get(key)
+            if response is not None:
+                self._touch(key)
+                return response, None
+
+        embedding = self._embed(normalized)
+        if embedding is None:
+            return None, None
+
+        bucket = (persona, question_type)
+        best_score, best_key, best_response = self.threshold, None, None
+        with self._lock:
+            entries = list(self._vectors.items())
+        for entry_key, (entry_bucket, vector, cached) in entries:
+            if entry_bucket == bucket:
+                score = sum(map(mul, embedding, vector))
+                if score >= best_score:
+                    best_score, best_key, best_response = score, entry_key, cached
+        if best_key is not None:
+            with self._lock:
+                self._touch(best_key)
+        return best_response, embedding
+
+    def _touch(self, key: str):
+        """Mark an entry most recently used in both tiers (caller holds the lock)."""
+        if key in self._exact:
+            self._exact.move_to_end(key)
+        if key in self._vectors:
+            self._vectors.move_to_end(key)
+
+    def put(
+        self,
+        persona: str,
+        question_type: str,
+        question: str,
+        response: str,
+        embedding: Optional[List[float]] = None
+    ):
+        """Cache a response (cache-on-miss); the embedding enables semantic hits."""
+        key = self._key(persona, question_type, normalize_question(question))
+        with self._lock:
+            self._exact[key] = response
+            self._exact.move_to_end(key)
+            if len(self._exact) > self.max_entries:
+                self._exact.popitem(last=False)
+
+            if embedding is not None:
+                self._vectors[key] = ((persona, question_type), embedding, response)
+                self._vectors.move_to_end(key)
+                if len(self._vectors) > self.max_entries:
+                    self._vectors.popitem(last=False)
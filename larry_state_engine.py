@@ -1,6 +1,7 @@
 import os
 import re
 import json
+from concurrent.futures import ThreadPoolExecutor
 from google import genai
 from google.genai import types
 from typing import Dict, Any, Tuple, List
@@ -8,7 +9,9 @@ from typing import Dict, Any, Tuple, List
 # Import existing RAG utilities
 from larry_web_search import integrate_search_with_response
 from larry_neo4j_rag import get_neo4j_rag_context, is_neo4j_configured, is_faiss_configured, get_faiss_rag_context
+from larry_heuristics import detect_persona as _detect_persona, classify_problem_type as _classify_problem_type
 from larry_framework_recommender import (
+    prepare_context,
     recommend_frameworks,
     calculate_uncertainty_risk,
     get_framework_notification,
@@ -19,6 +22,14 @@ from larry_framework_recommender import (
 from larry_system_prompt_v3 import LARRY_SYSTEM_PROMPT_V3
 LARRY_SYSTEM_PROMPT = LARRY_SYSTEM_PROMPT_V3
 
+# Shared pool for the per-turn RAG lookups (web, Neo4j, FAISS), which are
+# independent network calls; one pool per process, not one per turn
+_RAG_EXECUTOR = ThreadPoolExecutor(max_workers=3, thread_name_prefix="larry-rag")
+
+def _analyze(message_lower: str) -> Tuple[str, str, int]:
+    """Return (persona, problem_type, initial_score) for an already lowercased message."""
+    return (_detect_persona(message_lower), *_classify_problem_type(message_lower))
+
 class LarryStateEngine:
     """
     A simple, stateful engine to manage the conversation flow, persona,
@@ -40,45 +51,29 @@ class LarryStateEngine:
         
     def _detect_persona(self, message: str) -> str:
         """Simple heuristic for persona detection."""
-        message_lower = message.lower()
-        if any(word in message_lower for word in ["startup", "founder", "venture", "market fit"]):
-            return "entrepreneur"
-        elif any(word in message_lower for word in ["corporate", "company", "stakeholder", "portfolio"]):
-            return "corporate"
-        elif any(word in message_lower for word in ["research", "theory", "hypothesis", "literature"]):
-            return "researcher"
-        elif any(word in message_lower for word in ["client", "workshop", "facilitate", "consult"]):
-            return "consultant"
-        elif any(word in message_lower for word in ["exam", "study", "assignment"]):
-            return "student"
-        return "general"
+        return _detect_persona(message.lower())
 
     def _classify_problem_type(self, message: str) -> Tuple[str, int]:
         """Classify problem type and return type and initial uncertainty score."""
-        message_lower = message.lower()
-        if any(word in message_lower for word in ["future", "trend", "macro", "scenario", "long-term", "disrupt"]):
-            return "undefined", 0
-        elif any(word in message_lower for word in ["opportunity", "near-term", "expansion", "growth", "next step"]):
-            return "ill-defined", 50
-        elif any(word in message_lower for word in ["implement", "build", "execute", "prototype", "solution", "finalize"]):
-            return "well-defined", 85
-        return "general", 50
+        return _classify_problem_type(message.lower())
 
     def _update_state(self, user_message: str):
         """Updates persona, problem type, and calculates risk/uncertainty."""
         
+        # Lowercase once; every heuristic below reads the same normalized text
+        context = prepare_context(user_message)
+        new_persona, new_problem_type, initial_score = _analyze(context.lower)
+
         # 1. Update Persona (if a stronger signal is found)
-        new_persona = self._detect_persona(user_message)
         if new_persona != "general":
             self.persona = new_persona
             
         # 2. Update Problem Type
-        new_problem_type, initial_score = self._classify_problem_type(user_message)
         self.problem_type = new_problem_type
         
         # 3. Calculate Uncertainty/Risk
         uncertainty_level, risk_level, uncertainty_score, risk_score = calculate_uncertainty_risk(
-            self.problem_type, user_message
+            self.problem_type, context
         )
         self.uncertainty_score = uncertainty_score
         self.risk_score = risk_score
@@ -87,42 +82,50 @@ class LarryStateEngine:
         self.recommended_frameworks = recommend_frameworks(
             self.problem_type,
             self.persona,
-            user_message,
+            context,
             max_recommendations=3
         )
 
     def _orchestrate_rag(self, user_message: str) -> Tuple[str, str, str]:
-        """Orchestrates the three RAG sources (Web, Neo4j, FAISS)."""
+        """Orchestrates the three RAG sources (Web, Neo4j, FAISS), queried concurrently."""
         
         search_results = ""
         neo4j_context = ""
         faiss_context = ""
+        search_future = neo4j_future = faiss_future = None
         
         # 1. Web Search (Exa.ai)
         if self.exa_api_key:
-            # Simulate Streamlit spinner for the UI
-            # with st.spinner("🔍 Searching latest research..."):
-            search_results = integrate_search_with_response(
+            search_future = _RAG_EXECUTOR.submit(
+                integrate_search_with_response,
                 user_message=user_message,
                 persona=self.persona,
                 problem_type=self.problem_type,
                 exa_api_key=self.exa_api_key
             )
             
-        # 2. Neo4j Graph RAG (Network-Effect)
+        # 2. Neo4j Graph RAG (Network-Effect); Cypher generation is an LLM
+        # round-trip, so it overlaps with the web search instead of following it
         if is_neo4j_configured():
-            # with st.spinner("🌐 Querying Network-Effect Graph..."):
-            neo4j_context, neo4j_error = get_neo4j_rag_context(
+            neo4j_future = _RAG_EXECUTOR.submit(
+                get_neo4j_rag_context,
                 user_message, self.persona, self.problem_type, self.api_key
             )
-            if neo4j_error:
-                print(f"Neo4j RAG Error: {neo4j_error}")
-                neo4j_context = ""
                 
         # 3. FAISS Vector RAG (Simulated)
         if is_faiss_configured():
-            # with st.spinner("🧠 Searching Vector Store (FAISS)..."):
-            faiss_context = get_faiss_rag_context(user_message)
+            faiss_future = _RAG_EXECUTOR.submit(get_faiss_rag_context, user_message)
+
+        # Total latency is the slowest source rather than the sum of all three
+        if search_future:
+            search_results = search_future.result()
+        if neo4j_future:
+            neo4j_context, neo4j_error = neo4j_future.result()
+            if neo4j_error:
+                print(f"Neo4j RAG Error: {neo4j_error}")
+                neo4j_context = ""
+        if faiss_future:
+            faiss_context = faiss_future.result()
             
         return search_results, neo4j_context, faiss_context
 
@@ -0,0 +1,34 @@
+"""
+Larry Navigator - File Search store info
+Shared, cached loader for larry_store_info.json
+"""
+
+from functools import lru_cache
+from pathlib import Path
+
+# orjson is optional: several times faster than the stdlib parser on large files
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+STORE_INFO_FILE = "larry_store_info.json"
+
+
+@lru_cache(maxsize=1)
+def _load_store_info(path: str, mtime: float) -> dict:
+    """Parse the store info file; mtime is part of the key so edits bust the cache."""
+    return _json_loads(Path(path).read_bytes())
+
+
+def load_store_info(path: str = STORE_INFO_FILE) -> dict:
+    """
+    Return the parsed store info, re-reading only when the file changes.
+
+    The dict is shared between callers - treat it as read-only.
+    Returns {} if the file does not exist (checked with a stat, not an exception).
+    """
+    store_path = Path(path)
+    if not store_path.is_file():
+        return {}
+    return _load_store_info(path, store_path.stat().st_mtime)
@@ -349,3 +349,6 @@ You are now Larry's Uncertainty Navigator. Your first interaction with any user
 
 **Remember: Start with the problem, not the answer. Guide through uncertainty with structure. Drive to concrete action.**
 """
+
+# Versioned alias kept for modules that import the v3 prompt by name
+LARRY_SYSTEM_PROMPT_V3 = LARRY_SYSTEM_PROMPT
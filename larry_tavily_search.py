@@ -5,6 +5,7 @@ Real-time web search optimized for AI applications with proper source citation
 """
 
 import os
+from functools import lru_cache
 from typing import List, Dict, Optional
 
 try:
@@ -83,6 +84,16 @@ def construct_search_query(user_message: str, persona: str, problem_type: str) -
 
     return query.strip()
 
+@lru_cache(maxsize=None)
+def get_tavily_client(tavily_api_key: str):
+    """
+    Return the process-wide Tavily client for an API key.
+
+    Built once and reused by every search (LarryChat, WebSearchTool, the
+    UncertaintyNavigator tool) instead of constructing a new client per call.
+    """
+    return TavilyClient(api_key=tavily_api_key)
+
 def search_with_tavily(
     query: str,
     tavily_api_key: str,
@@ -112,8 +123,8 @@ def search_with_tavily(
         return None
 
     try:
-        # Initialize Tavily client
-        tavily = TavilyClient(api_key=tavily_api_key)
+        # Reuse the shared Tavily client
+        tavily = get_tavily_client(tavily_api_key)
 
         # Search with Tavily
         results = tavily.search(
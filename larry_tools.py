@@ -14,6 +14,7 @@ from google.generativeai import types
 from larry_tavily_search import integrate_search_with_response  # Updated to use Tavily instead of Exa
 from larry_neo4j_rag import is_neo4j_configured
 from larry_framework_recommender import calculate_uncertainty_risk
+from larry_heuristics import detect_persona, classify_problem_type
 from larry_system_prompt_v3 import LARRY_SYSTEM_PROMPT
 from larry_config import CLAUDE_MODEL, CLAUDE_MAX_TOKENS, CLAUDE_TEMPERATURE_DEFAULT
 
@@ -270,33 +271,10 @@ class ContextUpdateTool(BaseTool):
     args_schema: Type[BaseModel] = ContextUpdateToolInput
     
     def _run(self, user_message: str) -> str:
-        # 1. Simple Heuristic for Persona/Problem Type (from larry_state_engine.py)
-        def _detect_persona(message: str) -> str:
-            message_lower = message.lower()
-            if any(word in message_lower for word in ["startup", "founder", "venture", "market fit"]):
-                return "entrepreneur"
-            elif any(word in message_lower for word in ["corporate", "company", "stakeholder", "portfolio"]):
-                return "corporate"
-            elif any(word in message_lower for word in ["research", "theory", "hypothesis", "literature"]):
-                return "researcher"
-            elif any(word in message_lower for word in ["client", "workshop", "facilitate", "consult"]):
-                return "consultant"
-            elif any(word in message_lower for word in ["exam", "study", "assignment"]):
-                return "student"
-            return "general"
-
-        def _classify_problem_type(message: str) -> str:
-            message_lower = message.lower()
-            if any(word in message_lower for word in ["future", "trend", "macro", "scenario", "long-term", "disrupt"]):
-                return "undefined"
-            elif any(word in message_lower for word in ["opportunity", "near-term", "expansion", "growth", "next step"]):
-                return "ill-defined"
-            elif any(word in message_lower for word in ["implement", "build", "execute", "prototype", "solution", "finalize"]):
-                return "well-defined"
-            return "general"
-
-        persona = _detect_persona(user_message)
-        problem_type = _classify_problem_type(user_message)
+        # 1. Simple Heuristic for Persona/Problem Type (module-level, cached)
+        message_lower = user_message.lower()
+        persona = detect_persona(message_lower)
+        problem_type, _ = classify_problem_type(message_lower)
         
         # 2. Calculate Uncertainty/Risk
         uncertainty_level, risk_level, uncertainty_score, risk_score = calculate_uncertainty_risk(
@@ -7,12 +7,27 @@ Creates the graph schema optimized for PWS methodology and innovation frameworks
 import os
 from neo4j import GraphDatabase
 
+from larry_config import EMBEDDING_BATCH_SIZE, GRAPH_EMBEDDING_DIMENSIONS, GRAPH_EMBEDDING_MODEL
+from larry_gemini_client import get_client
+
 # Configuration
 NEO4J_URI = os.getenv("NEO4J_URI", "neo4j+s://your-instance.databases.neo4j.io")
 NEO4J_USER = os.getenv("NEO4J_USER", "neo4j")
 NEO4J_PASSWORD = os.getenv("NEO4J_PASSWORD", "your-password")
 NEO4J_DATABASE = os.getenv("NEO4J_DATABASE", "neo4j")
 
+# Integer sort keys stored on the nodes, so queries ORDER BY an indexed
+# property instead of evaluating a CASE per row
+DIFFICULTY_RANKS = {"BEGINNER": 1, "INTERMEDIATE": 2, "ADVANCED": 3}
+HORIZON_RANKS = {"Now": 1, "New": 2, "Next": 3}
+
+# Problem types each portfolio horizon maps to (stored as MAPS_TO edges)
+HORIZON_PROBLEM_TYPES = {
+    "Now": ["Well-Defined"],
+    "New": ["Ill-Defined"],
+    "Next": ["Undefined", "Ill-Defined"],
+}
+
 
 class LarrySchemaInitializer:
     """Initialize and manage Neo4j schema for Larry Navigator"""
@@ -42,6 +57,7 @@ class LarrySchemaInitializer:
             "CREATE CONSTRAINT concept_name IF NOT EXISTS FOR (c:Concept) REQUIRE c.name IS UNIQUE",
             "CREATE CONSTRAINT problem_type_name IF NOT EXISTS FOR (p:ProblemType) REQUIRE p.name IS UNIQUE",
             "CREATE CONSTRAINT persona_name IF NOT EXISTS FOR (p:Persona) REQUIRE p.name IS UNIQUE",
+            "CREATE CONSTRAINT portfolio_horizon_name IF NOT EXISTS FOR (h:PortfolioHorizon) REQUIRE h.name IS UNIQUE",
             "CREATE CONSTRAINT topic_name IF NOT EXISTS FOR (t:Topic) REQUIRE t.name IS UNIQUE",
 
             # Content entities
@@ -66,9 +82,18 @@ class LarrySchemaInitializer:
             "CREATE FULLTEXT INDEX framework_search IF NOT EXISTS FOR (f:Framework) ON EACH [f.name, f.description]",
             "CREATE FULLTEXT INDEX concept_search IF NOT EXISTS FOR (c:Concept) ON EACH [c.name, c.description]",
             "CREATE FULLTEXT INDEX document_search IF NOT EXISTS FOR (d:DocumentChunk) ON EACH [d.content]",
+            "CREATE FULLTEXT INDEX author_expertise_search IF NOT EXISTS FOR (a:Author) ON EACH [a.expertise]",
+            "CREATE FULLTEXT INDEX book_title_search IF NOT EXISTS FOR (b:Book) ON EACH [b.title]",
+
+            # Vector (HNSW) indexes for semantic search (Neo4j 5.11+)
+            f"CREATE VECTOR INDEX framework_embeddings IF NOT EXISTS FOR (f:Framework) ON (f.embedding) "
+            f"OPTIONS {{indexConfig: {{`vector.dimensions`: {GRAPH_EMBEDDING_DIMENSIONS}, `vector.similarity_function`: 'cosine'}}}}",
+            f"CREATE VECTOR INDEX concept_embeddings IF NOT EXISTS FOR (c:Concept) ON (c.embedding) "
+            f"OPTIONS {{indexConfig: {{`vector.dimensions`: {GRAPH_EMBEDDING_DIMENSIONS}, `vector.similarity_function`: 'cosine'}}}}",
 
             # Property indexes for filtering
             "CREATE INDEX framework_difficulty IF NOT EXISTS FOR (f:Framework) ON (f.difficulty)",
+            "CREATE RANGE INDEX framework_difficulty_rank IF NOT EXISTS FOR (f:Framework) ON (f.difficulty_rank)",
             "CREATE INDEX problem_time_horizon IF NOT EXISTS FOR (p:ProblemType) ON (p.time_horizon)",
             "CREATE INDEX document_type IF NOT EXISTS FOR (d:DocumentChunk) ON (d.document_type)",
             "CREATE INDEX chunk_position IF NOT EXISTS FOR (d:DocumentChunk) ON (d.chunk_position)",
@@ -162,8 +187,17 @@ class LarrySchemaInitializer:
                 MERGE (h:PortfolioHorizon {name: $name})
                 SET h.description = $description,
                     h.resource_allocation = $resource_allocation,
-                    h.time_frame = $time_frame
-            """, horizon)
+                    h.time_frame = $time_frame,
+                    h.rank = $rank
+            """, {**horizon, "rank": HORIZON_RANKS[horizon["name"]]})
+
+            # Link to the problem types the horizon covers
+            for pt_name in HORIZON_PROBLEM_TYPES[horizon["name"]]:
+                self.execute_query("""
+                    MATCH (h:PortfolioHorizon {name: $horizon})
+                    MATCH (pt:ProblemType {name: $problem_type})
+                    MERGE (h)-[:MAPS_TO]->(pt)
+                """, {"horizon": horizon["name"], "problem_type": pt_name})
             print(f"✓ Created PortfolioHorizon: {horizon['name']}")
 
     def create_framework_nodes(self):
@@ -268,9 +302,10 @@ class LarrySchemaInitializer:
                 MERGE (f:Framework {name: $name})
                 SET f.description = $description,
                     f.difficulty = $difficulty,
+                    f.difficulty_rank = $difficulty_rank,
                     f.time_required = $time_required,
                     f.team_size = $team_size
-            """, fw)
+            """, {**fw, "difficulty_rank": DIFFICULTY_RANKS[fw["difficulty"]]})
 
             # Link to problem types
             for pt_name in fw['problem_types']:
@@ -336,6 +371,61 @@ class LarrySchemaInitializer:
             """, {"source": source, "target": target})
             print(f"✓ {source} -{rel}-> {target}")
 
+    def migrate_sort_ranks(self):
+        """Backfill difficulty_rank / rank on nodes created before they were stored"""
+        print("\nBackfilling sort ranks...")
+
+        self.execute_query("""
+            MATCH (f:Framework)
+            WHERE f.difficulty_rank IS NULL
+            SET f.difficulty_rank = CASE f.difficulty
+                WHEN 'BEGINNER' THEN 1
+                WHEN 'INTERMEDIATE' THEN 2
+                ELSE 3
+            END
+        """)
+        self.execute_query("""
+            MATCH (h:PortfolioHorizon)
+            WHERE h.rank IS NULL
+            SET h.rank = CASE h.name
+                WHEN 'Now' THEN 1
+                WHEN 'New' THEN 2
+                ELSE 3
+            END
+        """)
+        print("✓ Framework.difficulty_rank and PortfolioHorizon.rank set")
+
+    def create_embeddings(self):
+        """Embed Framework and Concept nodes that have no embedding yet (Gemini)"""
+        print("\nCreating node embeddings...")
+
+        client = get_client()
+        if client is None:
+            print("⚠ GOOGLE_AI_API_KEY not set - skipping embeddings (vector search disabled)")
+            return
+
+        for label in ("Framework", "Concept"):
+            rows = self.execute_query(f"""
+                MATCH (n:{label})
+                WHERE n.embedding IS NULL
+                RETURN n.name AS name, coalesce(n.description, '') AS description
+            """)
+            for start in range(0, len(rows), EMBEDDING_BATCH_SIZE):
+                batch = rows[start:start + EMBEDDING_BATCH_SIZE]
+                result = client.models.embed_content(
+                    model=GRAPH_EMBEDDING_MODEL,
+                    contents=[f"{row['name']}: {row['description']}" for row in batch]
+                )
+                self.execute_query(f"""
+                    UNWIND $rows AS row
+                    MATCH (n:{label} {{name: row.name}})
+                    CALL db.create.setNodeVectorProperty(n, 'embedding', row.embedding)
+                """, {"rows": [
+                    {"name": row["name"], "embedding": embedding.values}
+                    for row, embedding in zip(batch, result.embeddings)
+                ]})
+            print(f"✓ Embedded {len(rows)} {label} nodes")
+
     def initialize_schema(self):
         """Run full schema initialization"""
         print("=" * 60)
@@ -350,6 +440,8 @@ class LarrySchemaInitializer:
             self.create_framework_nodes()
             self.create_author_nodes()
             self.create_relationships()
+            self.migrate_sort_ranks()
+            self.create_embeddings()
 
             print("\n" + "=" * 60)
             print("✓ SCHEMA INITIALIZATION COMPLETE!")
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Test the chatbot's persona / question-type classifier
+"""
+
+import os
+
+import pytest
+
+# larry_chatbot exits at import without a key; classification never calls Gemini
+os.environ.setdefault("GOOGLE_AI_API_KEY", "test-key")
+
+from larry_chatbot import _classify
+
+
+@pytest.mark.parametrize("question, persona", [
+    ("tips for researchers", "researcher"),
+    ("our organizations are slow", "corporate"),
+    ("facilitating a workshop", "consultant"),
+    ("how do we validate demand", "entrepreneur"),
+    ("studying for finals", "student"),
+    ("my exam is on tuesday but my startup is busy", "student"),
+    ("tell me something", "general"),
+])
+def test_persona(question, persona):
+    assert _classify(question)[0] == persona
+
+
+@pytest.mark.parametrize("question, question_type", [
+    ("what is design thinking", "definitional"),
+    ("how do i run a sprint", "how-to"),
+    ("lean startup vs design thinking", "comparison"),
+    ("comparing two frameworks", "comparison"),
+    ("frameworks for devs", "general"),
+    ("any recommendations for my team", "strategic"),
+    ("case studies of blue ocean", "example"),
+    ("applying jobs to be done", "application"),
+    ("where can i find week 3", "navigation"),
+])
+def test_question_type(question, question_type):
+    assert _classify(question)[1] == question_type
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Test the Cypher query library's result cache
+"""
+
+import larry_cypher_queries as queries
+from larry_cypher_queries import TTLCache, invalidate_query_cache, run_query
+
+
+def test_ttl_cache_get_put():
+    cache = TTLCache(max_entries=4, ttl=60)
+    assert cache.get("a") is None
+    cache.put("a", 1)
+    assert cache.get("a") == 1
+
+
+def test_ttl_cache_expiry(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(queries.time, "monotonic", lambda: now[0])
+    cache = TTLCache(max_entries=4, ttl=10)
+    cache.put("a", 1)
+    now[0] = 110.0
+    assert cache.get("a") == 1
+    now[0] = 110.1
+    assert cache.get("a") is None
+
+
+def test_ttl_cache_lru_eviction():
+    cache = TTLCache(max_entries=2, ttl=60)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")  # a is now most recently used
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+
+
+def test_ttl_cache_clear():
+    cache = TTLCache()
+    cache.put("a", 1)
+    cache.clear()
+    assert cache.get("a") is None
+
+
+class _Driver:
+    def __init__(self):
+        self.runs = 0
+
+    def execute_query(self, query, params, database_=None):
+        self.runs += 1
+        return [{"name": "Design Thinking", "aliases": ["DT"]}], None, None
+
+
+def test_run_query_caches_frozen_records():
+    driver = _Driver()
+    records = run_query(driver, "list_framework_names")
+    assert run_query(driver, "list_framework_names") is records
+    assert driver.runs == 1
+    assert records[0]["aliases"] == ("DT",)
+
+
+def test_run_query_results_expire(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(queries.time, "monotonic", lambda: now[0])
+    driver = _Driver()
+    run_query(driver, "list_framework_names")
+    now[0] += queries.NEO4J_RESULT_CACHE_TTL_SECONDS + 1
+    run_query(driver, "list_framework_names")
+    assert driver.runs == 2
+
+
+def test_invalidate_query_cache():
+    driver = _Driver()
+    run_query(driver, "list_framework_names")
+    invalidate_query_cache()
+    run_query(driver, "list_framework_names")
+    assert driver.runs == 2
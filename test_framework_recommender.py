@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+"""
+Test the uncertainty / risk scoring against the scores of the original substring scan
+"""
+
+import pytest
+
+from larry_framework_recommender import calculate_uncertainty_risk
+
+
+@pytest.mark.parametrize("problem_type, message, expected", [
+    ("general", "there is a lot of uncertainty", ("high", "medium", 65, 50)),
+    ("general", "the market is unpredictable", ("high", "medium", 65, 50)),
+    ("general", "a big investment", ("medium", "medium", 50, 65)),
+    ("general", "the outcome is unknown", ("medium", "medium", 50, 50)),
+    ("ill-defined", "we should invest in a proven, safe option", ("medium", "medium", 50, 55)),
+    ("undefined", "future trends are uncertain", ("very-high", "medium", 100, 60)),
+    ("well-defined", "a tested prototype with low cost", ("low", "low", 25, 15)),
+    ("general", "is this a good bet?", ("medium", "medium", 50, 65)),
+    ("general", "hello", ("medium", "medium", 50, 50)),
+])
+def test_calculate_uncertainty_risk(problem_type, message, expected):
+    assert calculate_uncertainty_risk(problem_type, message) == expected
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Test the persona / problem-type keyword heuristics
+"""
+
+import pytest
+
+from larry_heuristics import detect_persona, classify_problem_type
+
+
+@pytest.mark.parametrize("message, persona", [
+    ("i am a consultant", "consultant"),
+    ("as a researcher", "researcher"),
+    ("our companies", "corporate"),
+    ("facilitating a session", "consultant"),
+    ("we are a startup", "entrepreneur"),
+    ("theories of change", "researcher"),
+])
+def test_detect_persona(message, persona):
+    assert detect_persona(message) == persona
+
+
+@pytest.mark.parametrize("message, problem_type", [
+    ("disruptive innovation", "undefined"),
+    ("implementation plan", "well-defined"),
+    ("executing the plan", "well-defined"),
+    ("new opportunities", "ill-defined"),
+    ("a rebuild of the app", "general"),
+    ("hello", "general"),
+])
+def test_classify_problem_type(message, problem_type):
+    assert classify_problem_type(message)[0] == problem_type
+
+
+def test_classify_problem_type_scores():
+    assert classify_problem_type("future trends") == ("undefined", 0)
+    assert classify_problem_type("growth plan") == ("ill-defined", 50)
+    assert classify_problem_type("build it") == ("well-defined", 85)
+    assert classify_problem_type("hello") == ("general", 50)
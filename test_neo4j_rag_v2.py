@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Test the Neo4j RAG result caching
+"""
+
+import pytest
+
+rag_v2 = pytest.importorskip("larry_neo4j_rag_v2")
+
+
+class _Result(list):
+    def consume(self):
+        pass
+
+
+class _Session:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+    def run(self, query, parameters, timeout=None):
+        self.driver.runs += 1
+        return _Result([{"framework": "Design Thinking", "problem_types": ["Ill-Defined"]}])
+
+
+class _Driver:
+    def __init__(self):
+        self.runs = 0
+
+    def session(self, **kwargs):
+        return _Session(self)
+
+
+@pytest.fixture
+def rag():
+    rag = rag_v2.LarryNeo4jRAG(uri="", user="", password="")
+    rag.driver = _Driver()
+    return rag
+
+
+def test_cached_records_are_read_only(rag):
+    records = rag.execute_query("MATCH (f) RETURN f")
+    with pytest.raises(TypeError):
+        records[0]["framework"] = "changed"
+    with pytest.raises(AttributeError):
+        records[0]["problem_types"].append("Un-Defined")
+
+    assert rag.execute_query("MATCH (f) RETURN f") is records
+    assert rag.driver.runs == 1
+
+
+def test_framework_details_is_a_copy(rag):
+    details = rag.get_framework_details("Design Thinking")
+    details["framework"] = "changed"
+    assert rag.get_framework_details("Design Thinking")["framework"] == "Design Thinking"
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Test the two-tier semantic response cache with a stub embedding client
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+import larry_gemini_client
+from larry_semantic_cache import SemanticCache
+
+
+class StubClient:
+    """Stands in for genai.Client: embeds known questions to fixed vectors"""
+
+    def __init__(self, vectors):
+        self.vectors = vectors
+        self.calls = 0
+        self.models = self
+
+    def embed_content(self, model, contents):
+        self.calls += 1
+        return SimpleNamespace(embeddings=[SimpleNamespace(values=self.vectors[text]) for text in contents])
+
+
+@pytest.fixture(autouse=True)
+def clear_embeddings():
+    larry_gemini_client._embeddings.clear()
+    yield
+    larry_gemini_client._embeddings.clear()
+
+
+def test_exact_match_hit_without_embedding():
+    cache = SemanticCache(None)
+    cache.put("student", "definitional", "What is Design Thinking?", "answer")
+    assert cache.get("student", "definitional", "  what is design   thinking ") == ("answer", None)
+
+
+@pytest.mark.parametrize("threshold, hit", [(0.6, True), (0.6000001, False)])
+def test_threshold_boundary(threshold, hit):
+    client = StubClient({"what is lean startup": [1.0, 0.0], "explain lean startup": [0.6, 0.8]})
+    cache = SemanticCache(client, threshold=threshold)
+    response, embedding = cache.get("general", "definitional", "What is lean startup?")
+    assert response is None
+    cache.put("general", "definitional", "What is lean startup?", "answer", embedding)
+
+    response, _ = cache.get("general", "definitional", "Explain lean startup")
+    assert response == ("answer" if hit else None)
+
+
+def test_buckets_are_isolated():
+    client = StubClient({"what is lean startup": [1.0, 0.0], "what is lean startup method": [1.0, 0.0]})
+    cache = SemanticCache(client, threshold=0.9)
+    _, embedding = cache.get("student", "definitional", "What is lean startup?")
+    cache.put("student", "definitional", "What is lean startup?", "answer", embedding)
+
+    assert cache.get("entrepreneur", "definitional", "What is lean startup method?")[0] is None
+    assert cache.get("student", "how-to", "What is lean startup method?")[0] is None
+    assert cache.get("student", "definitional", "What is lean startup method?")[0] == "answer"
+
+
+def test_lru_eviction():
+    client = StubClient({"a": [1.0, 0.0], "b": [0.0, 1.0], "c": [-1.0, 0.0]})
+    cache = SemanticCache(client, max_entries=2)
+    for question in ("a", "b"):
+        _, embedding = cache.get("general", "general", question)
+        cache.put("general", "general", question, question.upper(), embedding)
+
+    assert cache.get("general", "general", "a")[0] == "A"  # a is now most recently used
+    _, embedding = cache.get("general", "general", "c")
+    cache.put("general", "general", "c", "C", embedding)
+
+    assert cache.get("general", "general", "b")[0] is None
+    assert cache.get("general", "general", "a")[0] == "A"
+    assert cache.get("general", "general", "c")[0] == "C"
+
+
+def test_embeddings_are_reused():
+    client = StubClient({"what is lean startup": [1.0, 0.0]})
+    cache = SemanticCache(client)
+    cache.get("general", "general", "What is lean startup?")
+    cache.get("student", "general", "What is lean startup?")
+    assert client.calls == 1
+
+
+def test_embed_texts_batches_requests():
+    questions = [f"question {i}" for i in range(250)]
+    client = StubClient({question: [1.0, float(i)] for i, question in enumerate(questions)})
+    embeddings = larry_gemini_client.embed_texts(client, "model", questions)
+    assert client.calls == 3
+    assert embeddings == [[1.0, float(i)] for i in range(250)]
@@ -3,6 +3,7 @@ Session State Management for Larry Navigator v2.0
 Tracks 4-dimensional problem diagnosis
 """
 
+import time
 import streamlit as st
 from typing import Dict, Any, Optional
 from datetime import datetime
@@ -96,8 +97,9 @@ def initialize_session_state():
         }
 
     # Stats
-    if "session_start_time" not in st.session_state:
-        st.session_state.session_start_time = datetime.now().isoformat()
+    # Monotonic clock: cheap to read and immune to wall-clock jumps
+    if "session_start_monotonic" not in st.session_state:
+        st.session_state.session_start_monotonic = time.monotonic()
 
     if "total_turns" not in st.session_state:
         st.session_state.total_turns = 0
@@ -155,7 +157,7 @@ def add_message(role: str, content: str):
     st.session_state.messages.append({
         "role": role,
         "content": content,
-        "timestamp": datetime.now().isoformat()
+        "timestamp": time.time()  # epoch seconds; format only when displayed/exported
     })
     st.session_state.total_turns += 1
 
@@ -184,13 +186,12 @@ def set_agent_status(agent_name: str, status: str):
 
 def get_session_stats() -> Dict[str, Any]:
     """Get session statistics"""
-    start_time = datetime.fromisoformat(st.session_state.session_start_time)
-    duration = datetime.now() - start_time
+    elapsed = time.monotonic() - st.session_state.session_start_monotonic
 
     return {
         "total_turns": st.session_state.total_turns,
         "total_research_queries": st.session_state.total_research_queries,
-        "session_duration_minutes": int(duration.total_seconds() / 60),
+        "session_duration_minutes": int(elapsed // 60),
         "diagnosis_updates": st.session_state.diagnosis.update_count
     }
 
@@ -201,7 +202,7 @@ def reset_session():
     st.session_state.diagnosis = ProblemDiagnosis()
     st.session_state.research_history = []
     st.session_state.active_research = None
-    st.session_state.session_start_time = datetime.now().isoformat()
+    st.session_state.session_start_monotonic = time.monotonic()
     st.session_state.total_turns = 0
     st.session_state.total_research_queries = 0
 